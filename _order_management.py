@@ -1,7 +1,46 @@
+import math
+import sys
 import time
-import copy
+from collections import OrderedDict, defaultdict
+from itertools import chain, islice
 
 from enum import Enum
+
+from sortedcontainers import SortedDict
+
+# Minimum price increment, mirrors order_management.price_tick_size in config.yaml
+PRICE_TICK_SIZE = 0.01
+
+
+# Distance from the tick grid, in ticks, still treated as floating point
+# noise rather than an off-tick price
+_TICK_TOLERANCE = 1e-6
+
+
+def price_to_ticks(price, side=None):
+    """
+    Convert a price to an integer number of ticks.
+
+    The matching engine compares and keys prices in ticks so that crossing
+    checks and price levels are exact integer operations. Prices on the tick
+    grid (up to floating point noise) map to their tick. Off-tick limit
+    prices are moved to the nearest tick inside the limit - down for buys,
+    up for sells - so an order never trades beyond its limit; without a
+    side they are rounded to the nearest tick.
+
+    Args:
+        price (float): Price in currency units
+        side (OrderSide, optional): Side of the order the limit belongs to
+
+    Returns:
+        int: Price in units of PRICE_TICK_SIZE
+    """
+    ticks = price / PRICE_TICK_SIZE
+    nearest = round(ticks)
+    if side is None or abs(ticks - nearest) <= _TICK_TOLERANCE:
+        return int(nearest)
+    return math.floor(ticks) if side is _BUY else math.ceil(ticks)
+
 class OrderType(Enum):
     LIMIT = 1
     MARKET = 2
@@ -11,6 +50,14 @@ class OrderSide(Enum):
     BUY = 1
     SELL = 2
 
+# Enum members bound to module globals for identity checks on the hot path
+_LIMIT = OrderType.LIMIT
+_BUY = OrderSide.BUY
+_SELL = OrderSide.SELL
+
+# Price key limit of orders that trade at any price (market orders)
+_NO_LIMIT = float('inf')
+
 
 class NonPositiveQuantity(Exception):
     pass
@@ -58,14 +105,20 @@ class Order(ABC):
         NonPositiveQuantity: If quantity is not positive
         InvalidSide: If side is not BUY or SELL
     """
+    # Orders are created and read on every match, so they use slots instead of
+    # a per-instance __dict__ (smaller objects, faster attribute access)
+    __slots__ = ('id', 'symbol', 'quantity', 'side', 'time')
+
     def __init__(self, id, symbol, quantity, side, time):
         self.id = id
-        self.symbol = symbol
+        # Interned, so the per-symbol book and position lookups of every
+        # order with this symbol compare equal on identity
+        self.symbol = sys.intern(symbol) if type(symbol) is str else symbol
         if quantity > 0:
             self.quantity = quantity
         else:
             raise NonPositiveQuantity("Quantity Must Be Positive!")
-        if side in [OrderSide.BUY, OrderSide.SELL]:
+        if side is _BUY or side is _SELL:
             self.side = side
         else:
             raise InvalidSide("Side Must Be Either \"Buy\" or \"OrderSide.SELL\"!")
@@ -82,17 +135,21 @@ class LimitOrder(Order):
 
     Attributes:
         price (float): The limit price at which the order should execute
+        price_ticks (int): The limit price in ticks, used for matching
         type (OrderType): Set to OrderType.LIMIT
 
     Raises:
         NonPositivePrice: If price is not positive
     """
+    __slots__ = ('price', 'price_ticks', 'type')
+
     def __init__(self, id, symbol, quantity, price, side, time):
         super().__init__(id, symbol, quantity, side, time)
         if price > 0:
             self.price = price
         else:
             raise NonPositivePrice("Price Must Be Positive!")
+        self.price_ticks = price_to_ticks(price, side)
         self.type = OrderType.LIMIT
 
 
@@ -105,8 +162,13 @@ class MarketOrder(Order):
     over price certainty.
 
     Attributes:
+        price (None): Always None; a class attribute, so that code reading
+                      order.price needs no getattr default for market orders
         type (OrderType): Set to OrderType.MARKET
     """
+    __slots__ = ('type',)
+    price = None
+
     def __init__(self, id, symbol, quantity, side, time):
         super().__init__(id, symbol, quantity, side, time)
         self.type = OrderType.MARKET
@@ -122,17 +184,21 @@ class IOCOrder(Order):
 
     Attributes:
         price (float): The limit price for execution
+        price_ticks (int): The limit price in ticks, used for matching
         type (OrderType): Set to OrderType.IOC
 
     Raises:
         NonPositivePrice: If price is not positive
     """
+    __slots__ = ('price', 'price_ticks', 'type')
+
     def __init__(self, id, symbol, quantity, price, side, time):
         super().__init__(id, symbol, quantity, side, time)
         if price > 0:
             self.price = price
         else:
             raise NonPositivePrice("Price Must Be Positive!")
+        self.price_ticks = price_to_ticks(price, side)
         self.type = OrderType.IOC
 
 
@@ -141,41 +207,317 @@ class FilledOrder(Order):
     Represents a completed/executed order.
 
     This class stores information about orders that have been successfully matched
-    and executed in the market.
+    and executed in the market. The matching engine emits one FilledOrder per side
+    of every trade; its quantity is the traded slice only, while a partially
+    filled resting order keeps its remainder in the book.
 
     Attributes:
         price (float): The execution price
         limit (bool): Whether this was originally a limit order
     """
+    __slots__ = ('price', 'limit')
+
     def __init__(self, id, symbol, quantity, price, side, time, limit = False):
         super().__init__(id, symbol, quantity, side, time)
         self.price = price
         self.limit = limit
-        
+
+    @classmethod
+    def acquire(cls, id, symbol, quantity, price, side, time, limit = False):
+        """
+        Get a FilledOrder, reusing a released instance when one is available.
+
+        Fields are assigned directly without the constructor's validation; the
+        matching engine only records positive trades between valid orders.
+
+        Args:
+            Same as FilledOrder()
+
+        Returns:
+            FilledOrder: The initialised fill record
+        """
+        # A single pop, not check-then-pop: the pool is shared by every
+        # engine, and another thread may empty it between the two steps
+        try:
+            fill = _FILL_POOL.pop()
+        except IndexError:
+            fill = cls.__new__(cls)
+        fill.id = id
+        fill.symbol = symbol
+        fill.quantity = quantity
+        fill.price = price
+        fill.side = side
+        fill.time = time
+        fill.limit = limit
+        return fill
+
+    @staticmethod
+    def release(fill):
+        """
+        Return a fill record that is no longer referenced to the pool.
+
+        Callers that consume fills and then drop them (e.g. backtest replays
+        that only aggregate) can release them so that later trades reuse the
+        objects instead of allocating new ones. The fill must not be used
+        after it has been released.
+
+        Args:
+            fill (FilledOrder): The fill record to recycle
+        """
+        if len(_FILL_POOL) < FILL_POOL_SIZE:
+            _FILL_POOL.append(fill)
+
+
+# Maximum number of released FilledOrder instances kept for reuse
+FILL_POOL_SIZE = 4096
+_FILL_POOL = []
+
+
+class FillReport(list):
+    """
+    FilledOrder records of one incoming order, with its totals.
+
+    The order handlers return a FillReport, so callers can still treat the
+    result as a list of fills while reading the incoming order's traded
+    quantity and average price without iterating over the fills again.
+
+    Attributes:
+        total_filled (int/float): Quantity of the incoming order that traded
+        notional (float): Sum of traded quantity times price
+    """
+    __slots__ = ('total_filled', 'notional')
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.total_filled = 0
+        self.notional = 0.0
+
+    @property
+    def vwap(self):
+        """Volume-weighted average fill price, or None if nothing traded."""
+        return self.notional / self.total_filled if self.total_filled else None
+
+
+class FlatPriceLevels():
+    """
+    Price levels of one book side stored in a flat array of price points.
+
+    For a symbol that trades in a known band of prices, every tick in the band
+    gets a slot in a list, and a cursor tracks the best non-empty slot. Adding
+    a level or reading the best level is O(1) with no tree or bisect work; the
+    cursor only walks forward over empty slots when the best level empties.
+    Keys outside the band are kept in an overflow SortedDict, so any price is
+    still accepted.
+
+    The class implements the subset of the SortedDict interface used by the
+    MatchingEngine, so it can stand in for either side of a SymbolBook.
+
+    Attributes:
+        low (int): Smallest key held in the flat array
+        levels (list): Level (or None) for each key from low upwards
+        best (int): Index of the first non-empty slot, len(levels) if none
+        overflow (SortedDict): Levels whose key falls outside the array
+    """
+    __slots__ = ('low', 'levels', 'best', 'overflow', '_count')
+
+    def __init__(self, low, high):
+        self.low = low
+        self.levels = [None] * (high - low + 1)
+        self.best = len(self.levels)
+        self.overflow = SortedDict()
+        self._count = 0
+
+    def __bool__(self):
+        return self._count > 0 or bool(self.overflow)
+
+    def __len__(self):
+        return self._count + len(self.overflow)
+
+    def get(self, key, default=None):
+        index = key - self.low
+        if 0 <= index < len(self.levels):
+            level = self.levels[index]
+            return default if level is None else level
+        return self.overflow.get(key, default)
+
+    def __setitem__(self, key, level):
+        index = key - self.low
+        if 0 <= index < len(self.levels):
+            if self.levels[index] is None:
+                self._count += 1
+            self.levels[index] = level
+            if index < self.best:
+                self.best = index
+        else:
+            self.overflow[key] = level
+
+    def __delitem__(self, key):
+        index = key - self.low
+        if 0 <= index < len(self.levels):
+            if self.levels[index] is None:
+                raise KeyError(key)
+            self.levels[index] = None
+            self._count -= 1
+            if index == self.best:
+                if self._count:
+                    # Advance the cursor past the slots that are now empty
+                    levels = self.levels
+                    index += 1
+                    while levels[index] is None:
+                        index += 1
+                    self.best = index
+                else:
+                    self.best = len(self.levels)
+        else:
+            del self.overflow[key]
+
+    def peekitem(self, index=0):
+        """
+        Return the best (index 0) (key, level) pair.
+
+        Args:
+            index (int): Only 0, the best level, is supported
+
+        Returns:
+            tuple: Key and level of the best price level
+
+        Raises:
+            IndexError: If there are no levels, or index is not 0
+        """
+        if index != 0:
+            raise IndexError("FlatPriceLevels only supports peeking the best level (index 0)")
+        overflow = self.overflow
+        if overflow and (not self._count or overflow.peekitem(0)[0] < self.low):
+            return overflow.peekitem(0)
+        if not self._count:
+            raise IndexError("peekitem on empty price levels")
+        return self.low + self.best, self.levels[self.best]
+
+    def values(self):
+        """Iterator over the levels in key order, best first."""
+        overflow = self.overflow
+        return chain((level for key, level in overflow.items() if key < self.low),
+                     (level for level in islice(self.levels, self.best, None) if level is not None),
+                     (level for key, level in overflow.items() if key >= self.low))
+
+
+class SymbolBook():
+    """
+    Bid and ask price levels of a single symbol.
+
+    Both sides map a price in ticks to the OrderedDict of resting orders at
+    that price. Bid keys are negated so that both sides iterate best price
+    first. Sides are SortedDicts unless the symbol has a price band, in which
+    case they are FlatPriceLevels covering the band.
+
+    Attributes:
+        bids (SortedDict/FlatPriceLevels): Buy price levels, highest price first
+        asks (SortedDict/FlatPriceLevels): Sell price levels, lowest price first
+    """
+    __slots__ = ('bids', 'asks')
+
+    def __init__(self, price_band=None):
+        if price_band is None:
+            self.bids = SortedDict()
+            self.asks = SortedDict()
+        else:
+            low, high = price_to_ticks(price_band[0]), price_to_ticks(price_band[1])
+            self.bids = FlatPriceLevels(-high, -low)
+            self.asks = FlatPriceLevels(low, high)
 
 
 class MatchingEngine():
     """
     Order matching engine implementing price-time priority algorithm.
 
-    The MatchingEngine maintains two order books (bid and ask) and matches
+    The MatchingEngine keeps a SymbolBook per symbol and matches
     incoming orders against resting orders using price-time priority:
     - Best prices get priority (highest bid, lowest ask)
-    - Among same prices, earlier orders execute first
+    - Among same prices, orders that reached the engine first execute first;
+      the time field is informational and never used for priority
+
+    Each side of a SymbolBook is a SortedDict mapping a price key to the
+    resting orders at that price in arrival (FIFO) order. An order only ever
+    sees the book of its own symbol, and matching only touches the best
+    price level until the incoming order stops crossing, so an order costs
+    O(k + log P) for k fills over P price levels instead of a scan of the whole
+    book.
+
+    Symbols given a price band use FlatPriceLevels instead of SortedDicts, so
+    best-price access and new levels are O(1) for prices inside the band.
+
+    A price level is an OrderedDict keyed by order id - a hash map over a
+    doubly-linked list - so together with the orders_by_id index an order can
+    be found and unlinked from the middle of its queue in O(1) for amendments
+    and cancellations.
 
     Attributes:
-        bid_book (list): List of buy orders, sorted by (-price, time)
-        ask_book (list): List of sell orders, sorted by (price, -time)
+        books (defaultdict): Maps each symbol to its SymbolBook
+        bid_book (list): Snapshot of resting buy orders, best price first
+        ask_book (list): Snapshot of resting sell orders, best price first
+        orders_by_id (dict): Maps the id of each resting order to its
+            (levels, price key, level) location in the book
+
+    Args:
+        price_bands (dict, optional): Maps a symbol to the (low, high) prices
+            to keep in a flat price-point array
 
     Example:
         >>> engine = MatchingEngine()
         >>> order = LimitOrder(1, "AAPL", 100, 150.50, OrderSide.BUY, time.time())
         >>> filled = engine.handle_order(order)
     """
-    def __init__(self):
-        # These are the order books you are given and expected to use for matching the orders below
-        self.bid_book = []
-        self.ask_book = []
+    def __init__(self, price_bands=None):
+        # symbol -> SymbolBook of SortedDict(price key -> OrderedDict(order id -> order))
+        self.books = defaultdict(SymbolBook)
+        for symbol, price_band in (price_bands or {}).items():
+            self.books[symbol] = SymbolBook(price_band)
+        # order id -> (levels, price key, level) for every resting order
+        self.orders_by_id = {}
+        # order type -> bound handler, so routing is a single dict lookup
+        self._dispatch = {
+            OrderType.LIMIT: self.handle_limit_order,
+            OrderType.MARKET: self.handle_market_order,
+            OrderType.IOC: self.handle_ioc_order,
+        }
+
+    @property
+    def bid_book(self):
+        """List of resting buy orders in price-time priority, grouped by symbol."""
+        return [book for symbol_book in self.books.values()
+                for level in symbol_book.bids.values() for book in level.values()]
+
+    @property
+    def ask_book(self):
+        """List of resting sell orders in price-time priority, grouped by symbol."""
+        return [book for symbol_book in self.books.values()
+                for level in symbol_book.asks.values() for book in level.values()]
+
+    def top_bids(self, n=5):
+        """
+        Iterate over the first n orders of bid_book without building the list.
+
+        Args:
+            n (int): Maximum number of orders to yield
+
+        Returns:
+            iterator: Resting buy orders in price-time priority, grouped by symbol
+        """
+        return islice((book for symbol_book in self.books.values()
+                       for level in symbol_book.bids.values() for book in level.values()), n)
+
+    def top_asks(self, n=5):
+        """
+        Iterate over the first n orders of ask_book without building the list.
+
+        Args:
+            n (int): Maximum number of orders to yield
+
+        Returns:
+            iterator: Resting sell orders in price-time priority, grouped by symbol
+        """
+        return islice((book for symbol_book in self.books.values()
+                       for level in symbol_book.asks.values() for book in level.values()), n)
 
     def handle_order(self, order):
         """
@@ -188,19 +530,42 @@ class MatchingEngine():
             UndefinedOrderType: If order type is not recognized
 
         Returns:
-            None for limit orders, list of FilledOrders for market/IOC orders
+            list: FilledOrder records produced by the order's handler
         """
         # Route order to appropriate handler based on order type
-        if order.type == OrderType.LIMIT:
-            self.handle_limit_order(order)
-        elif order.type == OrderType.IOC:
-            self.handle_ioc_order(order)
-        elif order.type == OrderType.MARKET:
-            self.handle_market_order(order)
-        else:
+        handler = self._dispatch.get(order.type)
+        if handler is None:
             # Raise error if the type of order is ambiguous or undefined
             raise UndefinedOrderType("Undefined Order Type!")
+        return handler(order)
+
 
+    def handle_orders(self, orders):
+        """
+        Route a batch of orders, in sequence, to their handlers.
+
+        Equivalent to calling handle_order for each order, but the dispatch
+        table and result list are bound once for the whole batch, which keeps
+        per-order overhead down when replaying large order streams.
+
+        Args:
+            orders (iterable): Order objects to process, in arrival order
+
+        Raises:
+            UndefinedOrderType: If an order type is not recognized
+
+        Returns:
+            list: FilledOrder records of the whole batch, in execution order
+        """
+        filled_orders = []
+        extend = filled_orders.extend
+        dispatch = self._dispatch
+        for order in orders:
+            handler = dispatch.get(order.type)
+            if handler is None:
+                raise UndefinedOrderType("Undefined Order Type!")
+            extend(handler(order))
+        return filled_orders
 
     def handle_limit_order(self, order):
         """
@@ -213,155 +578,23 @@ class MatchingEngine():
             order (LimitOrder): The limit order to process
 
         Returns:
-            list: List of FilledOrder objects representing executed trades
+            FillReport: List of FilledOrder objects representing executed trades
 
         Raises:
             UndefinedOrderSide: If order side is None or invalid
         """
-        filled_orders = []
-        # The orders that are filled from the market order need to be inserted into the above list
-
-        if order.side == None:
-            raise UndefinedOrderSide("Undefined Order Side!")            
-            
-        #Need to check if cross first 
-        if order.side == OrderSide.BUY:
-            temp_list = []
-            while self.ask_book:
-                
-                book =self.ask_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    #print("1. Adding ID to temp_list -> ", book.id, book.quantity)
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol) and (order.price <= book.price):
-                    
-                    #DEBUG
-                    #print("Limit Buy: ID {}, Price {}, Quantity {} -> Matched Bid ID {}, Price {}, Quantity {}".format(order.id,order.price,order.quantity,book.id, book.price, book.quantity))
-                    
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                        #print("Filled Book ID: ", book.id, " | Order ID: ", order.id, " has quantity remaining of ", order.quantity)
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                       
-                        #print("Book ID {} has quantity remaining of {}".format(mod_book_order.id, mod_book_order.quantity))
-                        #print("B. Adding ID to temp_list -> ", mod_book_order.id, mod_book_order.quantity)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                                                
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                        
-                else:
-                    #print("3. Adding ID to temp_list -> ", book.id, book.quantity)
-                    temp_list.append(book)    
-                        
-            #Send uncrossed orders back into book 
-            self.ask_book = temp_list.copy() 
-            
-            # Any quantity not crossed inserted into book 
-            if order.quantity > 0:
-                self.insert_limit_order(order)
-            
-        if order.side == OrderSide.SELL:
-            temp_list = []
-            while self.bid_book:
-                
-                book = self.bid_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    #print("A. Adding ID to temp_list -> ", book.id, book.quantity)
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol) and (order.price <= book.price):
-                    #print("Looking at Book ID: ", book.id, ", Quantity: ", book.quantity, " | Order: ", order.id, ", Amount: ", order.quantity)
-                    #DEBUG
-                    #print("Limit Sell: ID {}, Price {}, Quantity {} -> Matched Bid ID {}, Price {}, Quantity {}".format(order.id,order.price,order.quantity,book.id, book.price, book.quantity))
-                    
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                        #print("Filled Book ID: ", book.id, " | Order ID: ", order.id, " has quantity remaining of ", order.quantity)
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                       
-                        #print("Book ID {} has quantity remaining of {}".format(mod_book_order.id, mod_book_order.quantity))
-                        #print("B. Adding ID to temp_list -> ", mod_book_order.id, mod_book_order.quantity)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                                                
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                        
-                else:
-                    #print("C. Adding ID to temp_list -> ", book.id, book.quantity)
-                    temp_list.append(book)
-            
-            #print("Temp Book[0] ID | Quantity: {} | {} ".format(temp_list[0].id,temp_list[0].quantity))
-                    
-            #Send uncrossed orders back into book 
-            self.bid_book = temp_list.copy() 
-            
-            # Any quantity not crossed inserted into book 
-            if order.quantity > 0:
-                self.insert_limit_order(order)
-                
-        # DEBUG
-        """
-        if len(filled_orders) == 3:
-            
-            print("Filled Order IDs -> ", end="")
-            for order in filled_orders:
-                print("ID: ", order.id,"Price: ", order.price, "Time: ", order.time," || ", end=" ")
-            print(" ")
-            
-            print("Bid Book[0] ID: ", self.bid_book[0].id, " Quantity: ", self.bid_book[0].quantity, " Time: " ,self.bid_book[0].time)
-        """
+        symbol_book = self.books[order.symbol]
+        if order.side is _BUY:
+            filled_orders = self._match(order, symbol_book.asks, order.price_ticks)
+        elif order.side is _SELL:
+            filled_orders = self._match(order, symbol_book.bids, -order.price_ticks)
+        else:
+            raise UndefinedOrderSide("Undefined Order Side!")
+
+        # Any quantity not crossed inserted into book
+        if order.quantity > 0:
+            self.insert_limit_order(order)
+
         return filled_orders
 
     def handle_market_order(self, order):
@@ -370,134 +603,24 @@ class MatchingEngine():
 
         Market orders consume liquidity from the order book, executing against
         the best available prices until fully filled or the book is exhausted.
+        Any quantity left once the book is exhausted is cancelled.
 
         Args:
             order (MarketOrder): The market order to process
 
         Returns:
-            list: List of FilledOrder objects representing executed trades
+            FillReport: List of FilledOrder objects representing executed trades
 
         Raises:
             UndefinedOrderSide: If order side is None or invalid
         """
-        filled_orders = []
-
-        if order.side == None:
-            # You need to raise the following error if the side the order is for is ambiguous
-            raise UndefinedOrderSide("Undefined Order Side!")            
-            
-        #Need to check if cross first 
-        if order.side == OrderSide.BUY:
-            temp_list = []
-            
-            while self.ask_book:
-                
-                book =self.ask_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol):
-
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                        order.price = book.price                        
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                        
-                else:
-                    temp_list.append(book)    
-                                    
-            # Any quantity not crossed inserted into book
-            if order.quantity > 0:
-                temp_list.append(order)
-
-            #Send uncrossed orders back into book
-            self.ask_book = temp_list.copy()
-            # Sort ask book by price (lowest first), then time (earliest first)
-            self.ask_book = sorted(self.ask_book, key=lambda x: (x.price, x.time))
-            
-        if order.side == OrderSide.SELL:
-            temp_list = []
-            while self.bid_book:
-                
-                book = self.bid_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol):
-                    #DEBUG
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                        order.price = book.price                        
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                        
-                else:
-                    temp_list.append(book)
-
-            # Any quantity not crossed inserted into book 
-            if order.quantity > 0:
-                temp_list.append(order)
- 
-            #Send uncrossed orders back into book 
-            self.bid_book = temp_list.copy() 
-            self.bid_book = sorted(self.bid_book, key=lambda x: (x.price, x.time))
-            #print("The Bid Book[0]: ", self.bid_book[0].quantity, self.bid_book[0].id, "Filled Orders [0]: ID -> ", filled_orders[0].id)
-          
-        # The filled orders are expected to be the return variable (list)
-        return filled_orders
+        symbol_book = self.books[order.symbol]
+        if order.side is _BUY:
+            return self._match(order, symbol_book.asks, _NO_LIMIT)
+        if order.side is _SELL:
+            return self._match(order, symbol_book.bids, _NO_LIMIT)
+        # You need to raise the following error if the side the order is for is ambiguous
+        raise UndefinedOrderSide("Undefined Order Side!")
 
     def handle_ioc_order(self, order):
         """
@@ -510,130 +633,77 @@ class MatchingEngine():
             order (IOCOrder): The IOC order to process
 
         Returns:
-            list: List of FilledOrder objects representing executed trades
+            FillReport: List of FilledOrder objects representing executed trades
 
         Raises:
             UndefinedOrderSide: If order side is None or invalid
         """
-        filled_orders = []
+        symbol_book = self.books[order.symbol]
+        if order.side is _BUY:
+            return self._match(order, symbol_book.asks, order.price_ticks)
+        if order.side is _SELL:
+            return self._match(order, symbol_book.bids, -order.price_ticks)
+        # You need to raise the following error if the side the order is for is ambiguous
+        raise UndefinedOrderSide("Undefined Order Side!")
+
+    def _match(self, order, levels, limit_key):
+        """
+        Match an incoming order against the opposite side of its book.
 
-        if order.side == None:
-            # You need to raise the following error if the side the order is for is ambiguous
-            raise UndefinedOrderSide("Undefined Order Side!")            
-            
-        #Need to check if cross first 
-        if order.side == OrderSide.BUY:
-            temp_list = []
-            
-            while self.ask_book:
-                
-                book =self.ask_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol) and (order.price <= book.price):
-
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                        order.price = book.price                        
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                else:
-                    temp_list.append(book)
-
-            #Send uncrossed orders back into book
-            self.ask_book = temp_list.copy()
-            # Sort ask book by price (lowest first), then time (earliest first)
-            self.ask_book = sorted(self.ask_book, key=lambda x: (x.price, x.time))
-            
-        if order.side == OrderSide.SELL:
-            temp_list = []
-            while self.bid_book:
-                
-                book = self.bid_book.pop(0)
-                
-                # Order for a differnt stock goes back in the book
-                if (book.symbol != order.symbol) or order.quantity == 0:
-                    temp_list.append(book)
-    
-                # Correct stock and order price less/equal to price in book 
-                elif (book.symbol == order.symbol) and (order.price <= book.price):
-                    #DEBUG
-                    # Order Quantity > Book Quantity 
-                    if order.quantity > book.quantity:
-                        # Partially fill order
-                        order.quantity = order.quantity - book.quantity
-                        # Book entry sent to filled
-                        filled_orders.append(book) 
-                        book.quantity = 0
-                    
-                    # Book Quantity > Order Quantity 
-                    elif book.quantity > order.quantity:   
-                        book.quantity = (book.quantity-order.quantity)
-                        mod_book_order = copy.deepcopy(book)
-                        temp_list.append(mod_book_order)
-                        
-                        # Book partially filled
-                        book.quantity = order.quantity
-                        order.price = book.price                        
-                        # Fill the order
-                        filled_orders.append(order)
-                        filled_orders.append(book)             
-                        order.quantity = 0 
-                    
-                    # Order Quantity == Book Quantity                  
-                    else: 
-                        filled_orders.append(book) 
-                        filled_orders.append(order)
-                        order.quantity = 0
-                        book.quantity = 0
-                        
-                else:
-                    temp_list.append(book)
-
- 
-            #Send uncrossed orders back into book 
-            self.bid_book = temp_list.copy() 
-            self.bid_book = sorted(self.bid_book, key=lambda x: (x.price, x.time))
-            #print("The Bid Book[0]: ", self.bid_book[0].quantity, self.bid_book[0].id, "Filled Orders [0]: ID -> ", filled_orders[0].id)
-            
-        # The filled orders are expected to be the return variable (list)
-        return filled_orders
+        Both sides are keyed best price first (bids by negated price), so one
+        loop serves buys and sells: it walks the levels from the front while
+        their key does not exceed limit_key - the order's limit price in the
+        opposite side's key space, or _NO_LIMIT for market orders. The
+        incoming order's quantity is reduced by what was traded; whatever is
+        left is for the caller to post or cancel.
+
+        Args:
+            order (Order): The incoming order
+            levels (SortedDict/FlatPriceLevels): Opposite side price levels
+            limit_key (int/float): Worst price key the order may trade at
 
+        Returns:
+            FillReport: List of FilledOrder objects representing executed
+                        trades, with the incoming order's totals
+        """
+        filled_orders = FillReport()
+        orders_by_id = self.orders_by_id
+        quantity = order.quantity
+        notional = 0.0
+        while levels and quantity > 0:
+            key, level = levels.peekitem(0)
+            if key > limit_key:
+                break
+            book = next(iter(level.values()))
+
+            # Trade the smaller of the two quantities and retire the
+            # resting order once it is used up
+            traded = quantity if quantity < book.quantity else book.quantity
+            _record_trade(filled_orders, book, order, traded)
+            notional += traded * book.price
+            quantity -= traded
+            book.quantity -= traded
+            if book.quantity == 0:
+                level.popitem(last=False)
+                del orders_by_id[book.id]
+                if not level:
+                    del levels[key]
+
+        filled_orders.total_filled = order.quantity - quantity
+        filled_orders.notional = notional
+        order.quantity = quantity
+        return filled_orders
 
     def insert_limit_order(self, order):
         """
         Insert a limit order into the appropriate order book.
 
-        Orders are inserted into bid or ask book and sorted by price-time priority:
-        - Bid book: Sorted by highest price first, then earliest time
-        - Ask book: Sorted by lowest price first, then latest time
+        The order is appended to the FIFO queue of its price level in the book of
+        its symbol, creating the level if needed, and registered in orders_by_id.
+        The SortedDict keeps levels in price order, so no re-sorting of the book
+        is required:
+        - Bid book: Highest price first, then earliest arrival
+        - Ask book: Lowest price first, then earliest arrival
 
         Args:
             order (LimitOrder): The limit order to insert
@@ -642,41 +712,31 @@ class MatchingEngine():
             AssertionError: If order type is not LIMIT
             UndefinedOrderSide: If order side is invalid
         """
-        assert order.type == OrderType.LIMIT
-
-        if order.side == OrderSide.BUY:
-
-            if not self.bid_book:
-                self.bid_book.append(order)                
-            else:
-                self.bid_book.append(order)
-   
-        elif order.side == OrderSide.SELL:
-            
-            if not self.ask_book:
-                self.ask_book.append(order)
-                
-            else:
-                self.ask_book.append(order)
+        assert order.type is _LIMIT
+
+        if order.side is _BUY:
+            levels = self.books[order.symbol].bids
+            key = -order.price_ticks
+        elif order.side is _SELL:
+            levels = self.books[order.symbol].asks
+            key = order.price_ticks
         else:
             raise UndefinedOrderSide("Undefined Order Side!")
 
-        self.bid_book = sorted(self.bid_book, key=lambda x: (-x.price, x.time))
-        self.ask_book = sorted(self.ask_book, key=lambda x: (x.price, -x.time))
-        #self.bid_book.sort(key=lambda x: x.price, reverse=True)
-        #self.ask_book.sort(key=lambda x: x.price)
-        """
-        if order.side == OrderSide.SELL:
-            print("BID BOOK AFTER SELL ORDER: ", end="")
-            for order in self.bid_book:
-                print(order.id, " ", end="")
-        """
+        level = levels.get(key)
+        if level is None:
+            level = levels[key] = OrderedDict()
+        level[order.id] = order
+        self.orders_by_id[order.id] = (levels, key, level)
+
     def amend_quantity(self, id, quantity):
         """
         Amend the quantity of an existing order in the book.
 
         Only allows quantity reductions (not increases) to maintain fairness
-        in the order queue. Searches both bid and ask books for the order ID.
+        in the order queue. The order is located through orders_by_id, so the
+        amendment is O(1) and keeps the order's queue position. Amending to a
+        quantity of zero cancels the order.
 
         Args:
             id: The unique identifier of the order to amend
@@ -684,59 +744,70 @@ class MatchingEngine():
 
         Raises:
             NewQuantityNotSmaller: If new quantity is greater than existing quantity
+            NonPositiveQuantity: If new quantity is negative
 
         Returns:
             bool: True if amendment successful, False if order not found
         """
-        # Remember that there are two order books, one on the bid side and one on the ask side
-        found_order = False
-        for index, bid in enumerate(self.bid_book):
-            if bid.id == id:
-                found_order = True
-                if quantity > bid.quantity:
-                    # You need to raise the following error if the user attempts to modify an order
-                    # with a quantity that's greater than given in the existing order
-                    raise NewQuantityNotSmaller("Amendment Must Reduce Quantity!")
-                    return False
-                else:
-                    #print("Amending Order ID {} at Index {}: {} to {}".format(id, index,  bid.quantity, quantity))
-                    self.bid_book[index].quantity = quantity
-
-        if not found_order:
-            for ask in self.ask_book:
-                if ask.id == id:
-                    if quantity > ask.quantity:
-                        # You need to raise the following error if the user attempts to modify an order
-                        # with a quantity that's greater than given in the existing order
-                        raise NewQuantityNotSmaller("Amendment Must Reduce Quantity!")
-                        return False
-                    else:
-                        ask['quantity'] = quantity
-                        self.ask_book[id] = ask
-        
-        #print("Order quanty:", self.bid_book[0].quantity)
-        
+        entry = self.orders_by_id.get(id)
+        if entry is None:
+            return False
+
+        order = entry[2][id]
+        if quantity > order.quantity:
+            # You need to raise the following error if the user attempts to modify an order
+            # with a quantity that's greater than given in the existing order
+            raise NewQuantityNotSmaller("Amendment Must Reduce Quantity!")
+        if quantity < 0:
+            raise NonPositiveQuantity("Quantity Must Be Positive!")
+        if quantity == 0:
+            # A zero-quantity order must not stay in the book, where it would
+            # be matched for an empty trade
+            return self.cancel_order(id)
+        order.quantity = quantity
+        return True
+
     def cancel_order(self, id):
         """
         Cancel an order by removing it from the appropriate order book.
 
+        The order is unlinked from its price level in O(1); the level itself is
+        dropped from the book once it is empty.
+
         Args:
             id: The unique identifier of the order to cancel
 
         Returns:
             bool: True if order was found and cancelled, False otherwise
         """
-        # Search for order in bid book
-        for index, order in enumerate(self.bid_book):
-            if order.id == id:
-                del self.bid_book[index]
-                return True
-
-        # If not found in bid book, search ask book
-        for index, order in enumerate(self.ask_book):
-            if order.id == id:
-                del self.ask_book[index]
-                return True
-
-        # Order not found in either book
-        return False
+        entry = self.orders_by_id.pop(id, None)
+        if entry is None:
+            # Order not found in either book
+            return False
+
+        levels, key, level = entry
+        del level[id]
+        if not level:
+            del levels[key]
+        return True
+
+
+def _record_trade(filled_orders, book, order, quantity):
+    """
+    Append the fills for one trade between a resting and an incoming order.
+
+    Both sides are recorded at the resting order's price: first the resting
+    order, then the incoming order.
+
+    Args:
+        filled_orders (list): List the FilledOrder records are appended to
+        book (LimitOrder): The resting order being matched
+        order (Order): The incoming order
+        quantity (int/float): The traded quantity
+    """
+    acquire = FilledOrder.acquire
+    filled_orders.append(acquire(book.id, book.symbol, quantity, book.price,
+                                 book.side, book.time, limit=True))
+    filled_orders.append(acquire(order.id, order.symbol, quantity, book.price,
+                                 order.side, order.time,
+                                 limit=order.type is _LIMIT))
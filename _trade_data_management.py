@@ -16,14 +16,74 @@ Key Features:
 Author: Trading System
 """
 
-from scipy import stats
+from scipy.special import erfc, ndtr
+from collections import defaultdict
 import numpy as np
 import io
+import math
+import os
 import pandas as pd
 
-# Standard normal distribution functions for Black-Scholes
-_norm_cdf = stats.norm(0, 1).cdf  # Cumulative distribution function
-_norm_pdf = stats.norm(0, 1).pdf  # Probability density function
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; the NumPy pricing path is used without it
+    njit = None
+
+# Standard normal distribution functions for Black-Scholes. The ufunc is
+# called directly rather than through the frozen scipy.stats.norm object,
+# whose per-call argument handling dominates on small inputs.
+_norm_cdf = ndtr  # Cumulative distribution function
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+def _norm_sf(x):
+    """
+    Survival function N(-x) of the standard normal distribution.
+
+    Computed as erfc(x / sqrt(2)) / 2 rather than as 1 - N(x) or N(-x) of a
+    negated array, so that deep tails (deep out-of-the-money puts) keep their
+    relative precision.
+
+    Args:
+        x (float/np.ndarray): Point(s) at which to evaluate
+
+    Returns:
+        float/np.ndarray: Probability that a standard normal exceeds x
+    """
+    return 0.5 * erfc(x * _INV_SQRT_2)
+
+
+def _norm_pdf(x):
+    """
+    Probability density function of the standard normal distribution.
+
+    Args:
+        x (float/np.ndarray): Point(s) at which to evaluate the density
+
+    Returns:
+        float/np.ndarray: The density at x
+    """
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+def _discount(r, T):
+    """
+    Calculate the discount factor e^(-rT).
+
+    The strategy prices with r = 0, where the factor is exactly 1, so the
+    exponential over every time to expiry is skipped in that case.
+
+    Args:
+        r (float): Risk-free interest rate
+        T (float/np.ndarray): Time to expiration (in years)
+
+    Returns:
+        float/np.ndarray: The discount factor(s)
+    """
+    if r == 0:
+        return 1.0
+    return np.exp(-r * T)
 
 
 def _d1(S, K, T, r, sigma):
@@ -60,6 +120,28 @@ def _d2(S, K, T, r, sigma):
     return _d1(S, K, T, r, sigma) - sigma * np.sqrt(T)
 
 
+def _d1_d2(S, K, T, r, sigma):
+    """
+    Calculate both d1 and d2 for Black-Scholes formulas.
+
+    Shares the log-moneyness and sigma * sqrt(T) terms between the two
+    parameters instead of evaluating them twice through _d1 and _d2.
+
+    Args:
+        S (float): Current stock price
+        K (float): Strike price
+        T (float): Time to expiration (in years)
+        r (float): Risk-free interest rate
+        sigma (float): Volatility (annualized standard deviation)
+
+    Returns:
+        tuple: (d1, d2)
+    """
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / sigma_sqrt_T
+    return d1, d1 - sigma_sqrt_T
+
+
 def call_value(S, K, T, r, sigma):
     """
     Calculate theoretical call option value using Black-Scholes model.
@@ -77,7 +159,8 @@ def call_value(S, K, T, r, sigma):
     Returns:
         float: Theoretical call option value
     """
-    return S * _norm_cdf(_d1(S, K, T, r, sigma)) - K * np.exp(-r * T) * _norm_cdf(_d2(S, K, T, r, sigma))
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    return S * _norm_cdf(d1) - K * _discount(r, T) * _norm_cdf(d2)
 
 
 def put_value(S, K, T, r, sigma):
@@ -97,7 +180,8 @@ def put_value(S, K, T, r, sigma):
     Returns:
         float: Theoretical put option value
     """
-    return np.exp(-r * T) * K * _norm_cdf(-_d2(S, K, T, r, sigma)) - S * _norm_cdf(-_d1(S, K, T, r, sigma))
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    return _discount(r, T) * K * _norm_sf(d2) - S * _norm_sf(d1)
 
 
 def call_delta(S, K, T, r, sigma):
@@ -179,6 +263,98 @@ def put_vega(S, K, T, r, sigma):
     return call_vega(S, K, T, r, sigma)
 
 
+if njit is not None:
+    # No fastmath: rows at expiry (T = 0) divide by zero, and fastmath lets
+    # the compiler assume inf and nan never occur
+    @njit(parallel=True, cache=True)
+    def _bs_grid(S_ask, S_bid, T, K, is_call, r, sigma):
+        """
+        Compiled Black-Scholes values and deltas for every (time, strike) pair.
+
+        Rows are spread across cores with prange; each row evaluates all
+        strikes with scalar math, using N(x) = (1 + erf(x / sqrt(2))) / 2.
+
+        Args:
+            S_ask (np.ndarray): Stock ask price per row, shape (N,)
+            S_bid (np.ndarray): Stock bid price per row, shape (N,)
+            T (np.ndarray): Time to expiry per row, shape (N,)
+            K (np.ndarray): Strike per option, shape (M,)
+            is_call (np.ndarray): Whether each option is a call, shape (M,)
+            r (float): Risk-free interest rate
+            sigma (float): Volatility (annualized)
+
+        Returns:
+            tuple: (short values, long values, short deltas, long deltas),
+                   each of shape (N, M)
+        """
+        N, M = S_ask.shape[0], K.shape[0]
+        values_short = np.empty((N, M))
+        values_long = np.empty((N, M))
+        deltas_short = np.empty((N, M))
+        deltas_long = np.empty((N, M))
+        for i in prange(N):
+            sT = sigma * math.sqrt(T[i])
+            drift = (r + 0.5 * sigma * sigma) * T[i]
+            discount = math.exp(-r * T[i])
+            for j in range(M):
+                d1_ask = (math.log(S_ask[i] / K[j]) + drift) / sT
+                d1_bid = (math.log(S_bid[i] / K[j]) + drift) / sT
+                N1_ask = 0.5 * (1.0 + math.erf(d1_ask * 0.7071067811865476))
+                N1_bid = 0.5 * (1.0 + math.erf(d1_bid * 0.7071067811865476))
+                N2_ask = 0.5 * (1.0 + math.erf((d1_ask - sT) * 0.7071067811865476))
+                N2_bid = 0.5 * (1.0 + math.erf((d1_bid - sT) * 0.7071067811865476))
+                if is_call[j]:
+                    # Short calls sell at the ask, long calls buy at the bid
+                    values_short[i, j] = S_ask[i] * N1_ask - K[j] * discount * N2_ask
+                    values_long[i, j] = S_bid[i] * N1_bid - K[j] * discount * N2_bid
+                    deltas_short[i, j] = -N1_ask
+                    deltas_long[i, j] = N1_bid
+                else:
+                    # Long puts are priced off the ask, short puts off the bid;
+                    # N(-d) via erfc keeps precision in the deep tails
+                    values_long[i, j] = (
+                        discount * K[j] * 0.5 * math.erfc((d1_ask - sT) * 0.7071067811865476)
+                        - S_ask[i] * 0.5 * math.erfc(d1_ask * 0.7071067811865476))
+                    values_short[i, j] = (
+                        discount * K[j] * 0.5 * math.erfc((d1_bid - sT) * 0.7071067811865476)
+                        - S_bid[i] * 0.5 * math.erfc(d1_bid * 0.7071067811865476))
+                    deltas_long[i, j] = N1_ask - 1.0
+                    deltas_short[i, j] = 1.0 - N1_bid
+        return values_short, values_long, deltas_short, deltas_long
+else:
+    _bs_grid = None
+
+
+
+
+def read_market_csv(filename):
+    """
+    Read a market data CSV file, indexed by its first column.
+
+    Every column but the index holds numbers in the usual files: declaring
+    them float64 up front spares the parser its type inference. The index is
+    kept as object by position (the C parser accepts column numbers as dtype
+    keys), so it parses whatever its header is named. A file with a column
+    that is not numeric is read again with the types inferred. Files on disk
+    are read through a memory map; in-memory buffers are read as they are.
+
+    Args:
+        filename (str): Path to CSV file, or an open file or buffer
+
+    Returns:
+        pd.DataFrame: File contents indexed by the first column
+    """
+    on_disk = isinstance(filename, (str, os.PathLike))
+    start = None if on_disk else filename.tell()
+    try:
+        return pd.read_csv(filename, index_col=0, engine='c',
+                           dtype=defaultdict(lambda: np.float64, {0: object}),
+                           memory_map=on_disk)
+    except ValueError:
+        if start is not None:
+            filename.seek(start)
+        return pd.read_csv(filename, index_col=0, engine='c', dtype={0: object},
+                           memory_map=on_disk)
 
 
 def read_data(filename):
@@ -198,21 +374,29 @@ def read_data(filename):
         tuple: (time_to_expiry DataFrame, market_data DataFrame with multi-level columns)
                market_data columns are structured as (instrument, field)
     """
-    df = pd.read_csv(filename, index_col=0)
+    df = read_market_csv(filename)
+
+    # Sort the column names into time to expiry, stock, put and call columns
+    # in one pass, splitting 'Field-Instrument' into (instrument, field)
+    expiry_columns, stock_columns, put_columns, call_columns = [], [], [], []
+    for column in df.columns:
+        if 'TimeToExpiry' in column:
+            expiry_columns.append(column)
+        if 'Stock' in column:
+            stock_columns.append((column, (column[-5:], column[:-6])))
+        if '-P' in column:
+            put_columns.append((column, (column[-3:], column[:-4])))
+        if '-C' in column:
+            call_columns.append((column, (column[-3:], column[:-4])))
 
     # Extract time to expiry column
-    time_to_expiry = df.filter(like='TimeToExpiry')
-
-    # Parse stock data and restructure columns
-    stock = df.filter(like='Stock')
-    stock.columns = [stock.columns.str[-5:], stock.columns.str[:-6]]
+    time_to_expiry = df[expiry_columns]
 
-    # Parse options data (both puts and calls)
-    options = pd.concat((df.filter(like='-P'), df.filter(like='-C')), axis=1)
-    options.columns = [options.columns.str[-3:], options.columns.str[:-4]]
-
-    # Combine stock and options into single DataFrame
-    market_data = pd.concat((stock, options), axis=1)
+    # Gather stock, put and call data into a single DataFrame with
+    # (instrument, field) columns
+    columns = stock_columns + put_columns + call_columns
+    market_data = df[[column for column, _ in columns]]
+    market_data.columns = pd.MultiIndex.from_tuples([parsed for _, parsed in columns])
 
     return time_to_expiry, market_data
 
@@ -257,6 +441,59 @@ def set_tte_to_market_data(market_data, time_to_expiry):
     return market_data
 
 
+def _split_options(option_names):
+    """
+    Split option names into calls and puts.
+
+    The kind of each option is decided once here, so that downstream code
+    handles each kind as a block instead of testing every option name. Both
+    lists are sorted, so frames built from them come out with their columns
+    already in sorted order.
+
+    Args:
+        option_names (list): List of option instruments (e.g., ['P60', 'C70'])
+
+    Returns:
+        tuple: (calls, puts) sorted lists of option names
+    """
+    option_names = sorted(option_names)
+    calls = [option for option in option_names if 'C' in option]
+    puts = [option for option in option_names if 'P' in option]
+    return calls, puts
+
+
+def _strikes(options):
+    """
+    Retrieve the strike prices from option names (e.g., 70 for 'C70').
+
+    Args:
+        options (list): List of option names
+
+    Returns:
+        np.ndarray: Strike per option as floats
+    """
+    return np.array([int(option[-2:]) for option in options], dtype=float)
+
+
+def _column_major(arrays):
+    """
+    Concatenate 2-D arrays side by side into one column-major array.
+
+    pandas stores a float frame as a (columns, rows) block, so a frame built
+    from a Fortran-ordered array adopts it without copying and every column
+    is contiguous in memory. The per-column reads and reductions on the
+    option frames downstream depend on that; keep this order='F'.
+
+    Args:
+        arrays (list): 2-D arrays with the same number of rows
+
+    Returns:
+        np.ndarray: Fortran-ordered array of the arrays' columns
+    """
+    out = np.empty((arrays[0].shape[0], sum(array.shape[1] for array in arrays)), order='F')
+    return np.concatenate(arrays, axis=1, out=out)
+
+
 def create_df_to_store_options_values_delta(market_data, option_names):
     """
     Calculate Black-Scholes theoretical values and deltas for all options.
@@ -274,82 +511,65 @@ def create_df_to_store_options_values_delta(market_data, option_names):
         tuple: (option_values DataFrame, option_deltas DataFrame)
                Both DataFrames have multi-level columns: (position_type, option_name)
     """
-    short_call_values = {}
-    long_call_values = {}
-    long_put_values = {}
-    short_put_values = {}
-    short_call_deltas = {}
-    long_call_deltas = {}
-    long_put_deltas = {}
-    short_put_deltas = {}
-    option_values = {}
-    option_deltas = {}
-
     # Hardcoded Black-Scholes parameters
     r = 0  # Risk-free rate (TODO: make configurable)
     sigma = 0.20  # Volatility - 20% (TODO: calculate from historical data)
 
-    # Forloop to create new columns with Call/Put names
-    for option in option_names:
-        # Retrieve K from the Option
-        K = int(option[-2:])
-
-        if 'C' in option:
-            short_call_values[option] = []
-            long_call_values[option] = []
-            short_call_deltas[option] = []
-            long_call_deltas[option] = []
-
-            # Forloop to calculate short/long call values and deltas
-            for time, stock_value in market_data.iterrows():
-                short_call_values[option].append(call_value(
-                    stock_value['Stock', 'AskPrice'], K, time, r, sigma))
-                long_call_values[option].append(call_value(
-                    stock_value['Stock', 'BidPrice'], K, time, r, sigma))
-                long_call_deltas[option].append(call_delta(
-                    stock_value['Stock', 'BidPrice'], K, time, r, sigma))
-                short_call_deltas[option].append(-call_delta(
-                    stock_value['Stock', 'AskPrice'], K, time, r, sigma))
-
-            option_values['Short Call', option] = short_call_values[option]
-            option_values['Long Call', option] = long_call_values[option]
-            option_deltas['Short Call', option] = short_call_deltas[option]
-            option_deltas['Long Call', option] = long_call_deltas[option]
-
-        if 'P' in option:
-            long_put_values[option] = []
-            short_put_values[option] = []
-            long_put_deltas[option] = []
-            short_put_deltas[option] = []
-
-            # Forloop to calculate short/long put values and deltas
-            for time, stock_value in market_data.iterrows():
-                long_put_values[option].append(
-                    put_value(stock_value['Stock', 'AskPrice'], K, time, r, sigma))
-                short_put_values[option].append(
-                    put_value(stock_value['Stock', 'BidPrice'], K, time, r, sigma))
-                long_put_deltas[option].append(
-                    put_delta(stock_value['Stock', 'AskPrice'], K, time, r, sigma))
-                short_put_deltas[option].append(-put_delta(
-                    stock_value['Stock', 'BidPrice'], K, time, r, sigma))
-   
-            # once you are iterating the loop, you can store the dictionaries
-            # into options values for short call, long call for values and deltas
-            option_values['Long Put', option] = long_put_values[option]
-            option_values['Short Put', option] = short_put_values[option]
-            option_deltas['Long Put', option] = long_put_deltas[option]
-            option_deltas['Short Put', option] = short_put_deltas[option]
+    calls, puts = _split_options(option_names)
+
+    # Price every (time, strike) pair at once: column vectors of length N for
+    # time to expiry and stock prices broadcast against row vectors of the M
+    # strikes (retrieved from the option names), giving (N, M) arrays
+    T = market_data.index.to_numpy(dtype=float)[:, None]
+    S_ask = market_data['Stock', 'AskPrice'].to_numpy(dtype=float)[:, None]
+    S_bid = market_data['Stock', 'BidPrice'].to_numpy(dtype=float)[:, None]
+    K_call = _strikes(calls)
+    K_put = _strikes(puts)
+
+    if _bs_grid is not None:
+        # Compiled kernel over the calls followed by the puts
+        n_calls = len(calls)
+        is_call = np.arange(n_calls + len(puts)) < n_calls
+        values_short, values_long, deltas_short, deltas_long = _bs_grid(
+            S_ask[:, 0], S_bid[:, 0], T[:, 0], np.concatenate((K_call, K_put)),
+            is_call, r, sigma)
+        values = [values_long, values_short]
+        deltas = [deltas_long, deltas_short]
+    else:
+        # The terms that only depend on time to expiry are evaluated once per
+        # row and shared by every strike, and each d1 serves both the value
+        # and the delta, rather than going through call_value/call_delta etc.
+        sigma_sqrt_T = sigma * np.sqrt(T)
+        drift = (r + 0.5 * sigma ** 2) * T
+        discount = _discount(r, T)
+        d1_call_ask = (np.log(S_ask / K_call) + drift) / sigma_sqrt_T
+        d1_call_bid = (np.log(S_bid / K_call) + drift) / sigma_sqrt_T
+        d1_put_ask = (np.log(S_ask / K_put) + drift) / sigma_sqrt_T
+        d1_put_bid = (np.log(S_bid / K_put) + drift) / sigma_sqrt_T
+        N1_call_ask = _norm_cdf(d1_call_ask)
+        N1_call_bid = _norm_cdf(d1_call_bid)
+
+        # Longs buy at the bid and shorts sell at the ask for calls, the other
+        # way round for puts
+        values = [S_bid * N1_call_bid - K_call * discount * _norm_cdf(d1_call_bid - sigma_sqrt_T),
+                  discount * K_put * _norm_sf(d1_put_ask - sigma_sqrt_T) - S_ask * _norm_sf(d1_put_ask),
+                  S_ask * N1_call_ask - K_call * discount * _norm_cdf(d1_call_ask - sigma_sqrt_T),
+                  discount * K_put * _norm_sf(d1_put_bid - sigma_sqrt_T) - S_bid * _norm_sf(d1_put_bid)]
+        deltas = [N1_call_bid,
+                  _norm_cdf(d1_put_ask) - 1,
+                  -N1_call_ask,
+                  1 - _norm_cdf(d1_put_bid)]
+    # Blocks are laid out in sorted column order: Long Call, Long Put,
+    # Short Call, Short Put, each over the sorted calls or puts
+    columns = pd.MultiIndex.from_tuples(
+        [('Long Call', option) for option in calls] +
+        [('Long Put', option) for option in puts] +
+        [('Short Call', option) for option in calls] +
+        [('Short Put', option) for option in puts])
 
     # Create DataFrames with index market_data
-    option_values = pd.DataFrame(option_values, index=market_data.index)
-    option_deltas = pd.DataFrame(option_deltas, index=market_data.index)
-
-    # Sort the DataFrames
-    option_values = option_values.reindex(sorted(option_values.columns), axis=1)
-    option_deltas = option_deltas.reindex(sorted(option_deltas.columns), axis=1)
-
-    # Rounding
-    option_values = round(option_values, 2)
+    option_values = pd.DataFrame(_column_major(values), index=market_data.index, columns=columns)
+    option_deltas = pd.DataFrame(_column_major(deltas), index=market_data.index, columns=columns)
 
     return option_values,option_deltas
 
@@ -370,32 +590,29 @@ def add_blacksholes_data_to_market_data(market_data, option_names,
     Returns:
         pd.DataFrame: Market data augmented with Black-Scholes calculations
     """
-    for option in option_names:
-        if "C" in option:
-            market_data[option,
-                        'Expected AskPrice'] = option_values['Short Call', option]
-            market_data[option,
-                        'Expected BidPrice'] = option_values['Long Call', option]
-            market_data[option,
-                        'Delta Short'] = option_deltas['Short Call', option].values
-            market_data[option,
-                        'Delta Long'] = option_deltas['Long Call', option].values
-    
-        elif "P" in option:
-            market_data[option,
-                        'Expected AskPrice'] = option_values['Short Put', option]
-            market_data[option,
-                        'Expected BidPrice'] = option_values['Long Put', option]
-            market_data[option,
-                        'Delta Short'] = option_deltas['Short Put', option].values
-            market_data[option,
-                        'Delta Long'] = option_deltas['Long Put', option].values
-        # elif you will do the same for Put
-
-    # Sort Columns
-    market_data = market_data.reindex(sorted(market_data.columns), axis=1)
-
-    return market_data
+    # Collect the new columns first and add them in one go, rather than
+    # inserting them into market_data one at a time
+    calls, puts = _split_options(option_names)
+    extras = {}
+    for options, short, long in ((calls, 'Short Call', 'Long Call'),
+                                 (puts, 'Short Put', 'Long Put')):
+        for option in options:
+            extras[option, 'Expected AskPrice'] = option_values[short, option].to_numpy()
+            extras[option, 'Expected BidPrice'] = option_values[long, option].to_numpy()
+            extras[option, 'Delta Short'] = option_deltas[short, option].to_numpy()
+            extras[option, 'Delta Long'] = option_deltas[long, option].to_numpy()
+
+    # Write the market data and the new columns straight into their sorted
+    # positions of one array, instead of a concat followed by a sorting copy
+    columns = sorted(list(market_data.columns) + list(extras))
+    position = {column: i for i, column in enumerate(columns)}
+    data = np.empty((len(market_data), len(columns)), order='F')
+    data[:, [position[column] for column in market_data.columns]] = market_data.to_numpy(dtype=float)
+    for column, values in extras.items():
+        data[:, position[column]] = values
+
+    return pd.DataFrame(data, index=market_data.index,
+                        columns=pd.MultiIndex.from_tuples(columns))
 
 def option_opportunities(option, market_data):
     """
@@ -415,26 +632,47 @@ def option_opportunities(option, market_data):
     Returns:
         tuple: (short_opportunities DataFrame, long_opportunities DataFrame)
     """
-    if "C" in option:
-        expected1 = market_data[option][(market_data[option, 'BidPrice'] - market_data[option,
-                                                                                       'Expected AskPrice']) >= 0.10].drop('Expected BidPrice', axis=1)
-        expected2 = market_data[option][(market_data[option, 'Expected BidPrice'] -
-                                         market_data[option, 'AskPrice']) >= 0.10].drop('Expected AskPrice', axis=1)
+    # Calls and puts are screened the same way. The rows are located on plain
+    # arrays and each result is taken with one row-and-column selection,
+    # instead of a boolean-indexed copy per mask followed by a drop copy.
+    data = market_data[option]
+    columns = data.columns
+    short_rows = np.flatnonzero(
+        (data['BidPrice'].to_numpy() - data['Expected AskPrice'].to_numpy()) >= 0.10)
+    long_rows = np.flatnonzero(
+        (data['Expected BidPrice'].to_numpy() - data['AskPrice'].to_numpy()) >= 0.10)
 
-    elif "P" in option:
-        expected1 = market_data[option][(market_data[option, 'BidPrice'] - market_data[option,
-                                                                                       'Expected AskPrice']) >= 0.10].drop('Expected BidPrice', axis=1)
-        expected2 = market_data[option][(market_data[option, 'Expected BidPrice'] -
-                                         market_data[option, 'AskPrice']) >= 0.10].drop('Expected AskPrice', axis=1)
+    expected1 = data.iloc[short_rows, np.flatnonzero(columns != 'Expected BidPrice')]
+    expected2 = data.iloc[long_rows, np.flatnonzero(columns != 'Expected AskPrice')]
 
     return expected1,expected2
 
 
+def _option_fields(values, columns, options, field):
+    """
+    Gather one field of several options from market data as a 2-D array.
+
+    Columns are resolved to integer positions once and taken from the
+    already materialized values array, instead of going through a
+    MultiIndex lookup and a DataFrame copy per field.
+
+    Args:
+        values (np.ndarray): market_data.to_numpy()
+        columns (pd.MultiIndex): market_data.columns, (instrument, field)
+        options (list): Option names, one array column each
+        field (str): Field to gather, e.g. 'BidPrice'
+
+    Returns:
+        np.ndarray: Array of shape (rows, len(options))
+    """
+    return values[:, [columns.get_loc((option, field)) for option in options]]
+
+
 def create_positions(market_data, option_names, timestamp):
     """
     Generate delta-neutral option positions based on arbitrage opportunities.
 
-    Iterates through market data and creates positions when arbitrage conditions
+    Scans market data and creates positions when arbitrage conditions
     are met. Automatically hedges option delta exposure with stock positions to
     maintain delta neutrality.
 
@@ -451,119 +689,56 @@ def create_positions(market_data, option_names, timestamp):
     Returns:
         pd.DataFrame: Position data with cumulative positions, deltas, and stock hedge
     """
-    # Create a Dictionary with Timestamp and Time to Expiry
-    # Index of market_data was changed earlier to time to expiry
-    trades = {('Timestamp', ''): timestamp,
-              ('Time to Expiry', ''): market_data.index}
-
-    # Forloop that adds columns for the Call/Put Positions and Deltas
-    # Global function is a changing variable name based on the option
-    # For option C60 it will create a variable named positions_call_C60
-    # Forloop over the rows of market_data
-    for option in option_names:
-
-        if 'C' in option:
-            trades['Call Position', option] = []
-            trades['Call Delta', option] = []
-            globals()['positions_call_' + option] = 0
-    
-        if 'P' in option:
-            trades['Put Position', option] = []
-            trades['Put Delta', option] = []
-            globals()['positions_put_' + option] = 0
-
-    for time, data in market_data.iterrows():
-
-        max_delta = min(data['Stock', 'AskVolume'], data['Stock', 'BidVolume'])
-    
-        # Forloop over the option_names with conditions
-        # if-statements if Call or Put + if Short/Long in Call or Put
-        for option in option_names:
-    
-            if 'C' in option:
-    
-                # Short Call
-                if (data[option, 'BidPrice'] - data[option, 'Expected AskPrice']) >= 0.10:
-                    short_call_volume = data[option, 'BidVolume']
-                    long_call_volume = 0
-    
-                # Long Call
-                elif (data[option, 'Expected BidPrice'] - data[option, 'AskPrice']) >= 0.10:
-                    long_call_volume = data[option, 'AskVolume']
-                    short_call_volume = 0
-    
-                else:
-                    long_call_volume = short_call_volume = 0
-    
-                call_trade = long_call_volume - short_call_volume
-    
-                # Define variable, as set earlier. Note the first position is set to zero otherwise
-                # One would get an error here since the variable is then not yet defined.
-                globals()['positions_call_' + option] = call_trade + \
-                    globals()['positions_call_' + option]
-    
-                # Add Positions (cumulative)
-                trades['Call Position', option].append(
-                    globals()['positions_call_' + option])
-    
-                if globals()['positions_call_' + option] >= 0:
-                    long_call_delta = data[option, 'Delta Long']
-                    short_call_delta = 0
-    
-                elif globals()['positions_call_' + option] < 0:
-                    short_call_delta = data[option, 'Delta Short']
-                    long_call_delta = 0
-    
-                # Add Deltas (cumulative)
-                trades['Call Delta', option].append(
-                    abs(globals()['positions_call_' + option]) * (long_call_delta + short_call_delta))
-    
-            if 'P' in option:
-    
-                # Short Put
-                if (data[option, 'BidPrice'] - data[option, 'Expected AskPrice']) >= 0.10:
-                    short_put_volume = data[option, 'BidVolume']
-                    long_put_volume = 0
-    
-                # Long Put
-                elif (data[option, 'Expected BidPrice'] - data[option, 'AskPrice']) >= 0.10:
-                    long_put_volume = data[option, 'AskVolume']
-                    short_put_volume = 0
-    
-                else:
-                    long_put_volume = short_put_volume = 0
-    
-                put_trade = long_put_volume - short_put_volume
-    
-                globals()['positions_put_' + option] = put_trade + \
-                    globals()['positions_put_' + option]
-    
-                trades['Put Position', option].append(
-                    globals()['positions_put_' + option])
-    
-                if globals()['positions_put_' + option] >= 0:
-                    long_put_delta = data[option, 'Delta Long']
-                    short_put_delta = 0
-    
-                elif globals()['positions_put_' + option] < 0:
-                    short_put_delta = data[option, 'Delta Short']
-                    long_put_delta = 0
-    
-                trades['Put Delta', option].append(
-                    abs(globals()['positions_put_' + option]) * (long_put_delta + short_put_delta))     
-    
-    trades = pd.DataFrame(trades).set_index('Timestamp')
-
-    # Sort Columns
-    trades = trades.reindex(sorted(trades.columns), axis=1)
-
-    # Calculate Total Option Delta (based on sorted columns)
-    trades['Total Option Delta', ''] = np.sum(
-        trades['Call Delta'], axis=1) + np.sum(trades['Put Delta'], axis=1)
-
-    # Calculate Cumulative Stock Position (floored if positive, ceiled if negative)
-    trades['Stock Position', 'Stock'] = -np.where(trades['Total Option Delta', ''] >= 0, np.floor(
-        trades['Total Option Delta', '']), np.ceil(trades['Total Option Delta', '']))
+    # Collect the delta and position blocks and their (group, option) names
+    # in sorted column order: Call Delta, Call Position, Put Delta,
+    # Put Position, over the sorted calls and puts
+    blocks, trade_columns = [], []
+    total_option_delta = np.zeros(len(market_data))
+
+    calls, puts = _split_options(option_names)
+    values = market_data.to_numpy(dtype=float)
+    columns = market_data.columns
+
+    # Every decision only depends on its own row, so all rows and options of
+    # one kind are handled at once as (N, M) arrays and the cumulative
+    # positions are a running sum down the rows
+    for kind, options in (('Call', calls), ('Put', puts)):
+        bid = _option_fields(values, columns, options, 'BidPrice')
+        ask = _option_fields(values, columns, options, 'AskPrice')
+
+        # Short when the market bid is 0.10 over the expected ask, otherwise
+        # long when the expected bid is 0.10 over the market ask
+        short = (bid - _option_fields(values, columns, options, 'Expected AskPrice')) >= 0.10
+        long = (_option_fields(values, columns, options, 'Expected BidPrice') - ask) >= 0.10
+        trade = np.where(short, -_option_fields(values, columns, options, 'BidVolume'),
+                         np.where(long, _option_fields(values, columns, options, 'AskVolume'), 0))
+
+        # Add Positions (cumulative) and their Deltas
+        positions = np.cumsum(trade, axis=0)
+        deltas = np.abs(positions) * np.where(
+            positions >= 0, _option_fields(values, columns, options, 'Delta Long'),
+            _option_fields(values, columns, options, 'Delta Short'))
+
+        blocks += [deltas, positions]
+        trade_columns += [(kind + ' Delta', option) for option in options]
+        trade_columns += [(kind + ' Position', option) for option in options]
+
+        # Deltas are NaN where there is no time left to expiry; they count as
+        # zero in the total, as they did in the DataFrame sum this replaces
+        total_option_delta += np.nansum(deltas, axis=1)
+
+    # Time to Expiry sorts last; the index of market_data was changed earlier to it
+    blocks.append(market_data.index.to_numpy(dtype=float)[:, None])
+    trade_columns.append(('Time to Expiry', ''))
+    trades = pd.DataFrame(_column_major(blocks), index=pd.Index(timestamp, name='Timestamp'),
+                          columns=pd.MultiIndex.from_tuples(trade_columns))
+
+    # Calculate Total Option Delta
+    trades['Total Option Delta', ''] = total_option_delta
+
+    # Calculate Cumulative Stock Position (floored if positive, ceiled if
+    # negative, i.e. truncated toward zero)
+    trades['Stock Position', 'Stock'] = -np.trunc(total_option_delta)
 
 
     trades['Remaining Option Delta', ''] = trades['Total Option Delta',
@@ -588,19 +763,24 @@ def create_orders(positions):
                - trades_diff: Period-over-period position changes (actual orders)
                - final_positions: Positions held at the final timestamp
     """
-    # Create trades_diff dataframe that gives all actual trades (not positions)
-    trades_diff = positions.diff()[1:].drop(
-    ['Call Delta', 'Put Delta', 'Time to Expiry', 'Total Option Delta', 'Remaining Option Delta'], axis=1)
+    # Only the 'Call Position', 'Put Position' and 'Stock Position' columns
+    # turn into orders; select them once by position
+    keep = np.flatnonzero(~positions.columns.get_level_values(0).isin(
+        ['Call Delta', 'Put Delta', 'Time to Expiry', 'Total Option Delta', 'Remaining Option Delta']))
+    position_values = positions.iloc[:, keep].to_numpy()
 
     # Drop the 'Call Position','Put Position' and 'Stock Position' top level
     # Makes forlooping easier
-    trades_diff.columns = trades_diff.columns.droplevel(level=0)
+    columns = positions.columns[keep].droplevel(level=0)
 
-    # Since positions are not neccesarily zero at the last timestamp, final positions are calculated to be able to valuate these
-    final_positions = positions[-1:].drop(['Call Delta', 'Put Delta', 'Time to Expiry',
-                                        'Total Option Delta', 'Remaining Option Delta'], axis=1)
+    # Create trades_diff dataframe that gives all actual trades (not positions),
+    # differencing the selected columns directly rather than the whole frame
+    trades_diff = pd.DataFrame(np.diff(position_values, axis=0),
+                               index=positions.index[1:], columns=columns)
 
-    final_positions.columns = final_positions.columns.droplevel(level=0)
+    # Since positions are not neccesarily zero at the last timestamp, final positions are calculated to be able to valuate these
+    final_positions = pd.DataFrame(position_values[-1:], index=positions.index[-1:],
+                                   columns=columns)
     return trades_diff,final_positions
 
 
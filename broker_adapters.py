@@ -11,10 +11,25 @@ Future Implementation: Add concrete adapters for real broker APIs
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Dict, Optional
+import asyncio
+import concurrent.futures
+import functools
+import itertools
+import logging
+import math
+import queue
+import threading
+import time
+from collections import namedtuple
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 import _order_management as om
 
+# Messages go through logging rather than print, so that they cost nothing
+# when the level is disabled; handlers (e.g. a QueueHandler to keep writes
+# off the order path) are configured by the application
+logger = logging.getLogger(__name__)
+
 
 class OrderStatus(Enum):
     """Order status enumeration."""
@@ -27,6 +42,50 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
+# Prefix of simulated order IDs, which are the prefix and a zero-padded counter
+_SIM_ORDER_ID_PREFIX = "SIM"
+
+# Statuses of orders that are still working at the broker
+_OPEN_STATUSES = (OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED)
+
+# Read-only view of an open order, with the fields of a get_open_orders dict
+OpenOrderView = namedtuple('OpenOrderView', 'order_id symbol qty side type price')
+
+
+def ttl_cache(ttl: float):
+    """
+    Cache a broker query method's result for up to ttl seconds.
+
+    Meant for account queries that cost a broker round trip, such as
+    get_positions and get_account_info. A cached result is dropped early
+    once the adapter calls invalidate_cache(), which adapters do on every
+    order event, so a poll never returns state older than the last event.
+    The cached object is returned as is and must not be mutated by callers.
+
+    Args:
+        ttl: Time to live of a cached result in seconds
+
+    Returns:
+        callable: Decorator for argument-less adapter methods
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self):
+            cache = self.__dict__.setdefault('_cache', {})
+            version = self.__dict__.get('_cache_version', 0)
+            now = time.monotonic()
+            entry = cache.get(name)
+            if entry is not None and entry[0] > now and entry[1] == version:
+                return entry[2]
+            value = method(self)
+            cache[name] = (now + ttl, version, value)
+            return value
+        return wrapper
+    return decorator
+
+
 class BrokerAdapter(ABC):
     """
     Abstract base class for broker connections.
@@ -72,6 +131,75 @@ class BrokerAdapter(ABC):
         """
         pass
 
+    def batch_submit_orders(self, orders: List[om.Order]) -> List[str]:
+        """
+        Submit several orders as one basket.
+
+        The default implementation submits the orders one at a time. Adapters
+        for brokers with a basket/batch endpoint should override this to send
+        the orders in as few requests as the broker allows.
+
+        Args:
+            orders: Order objects to submit
+
+        Returns:
+            list: Broker's order IDs, in the same order as orders
+
+        Raises:
+            ConnectionError: If not connected to broker
+        """
+        return [self.submit_order(order) for order in orders]
+
+    def batch_cancel_orders(self, order_ids: List[str]) -> List[bool]:
+        """
+        Cancel several orders as one basket.
+
+        Args:
+            order_ids: Broker's order IDs
+
+        Returns:
+            list: Whether each cancellation was successful
+        """
+        return [self.cancel_order(order_id) for order_id in order_ids]
+
+    def invalidate_cache(self):
+        """
+        Expire all results cached with ttl_cache.
+
+        Call on anything that changes orders, positions or cash.
+        """
+        self._cache_version = self.__dict__.get('_cache_version', 0) + 1
+
+    async def submit_order_async(self, order: om.Order) -> str:
+        """
+        Submit an order without blocking the event loop.
+
+        The default implementation runs submit_order in the loop's default
+        executor. Adapters for network brokers should override this with a
+        native coroutine (e.g. an async HTTP client or ib_insync's *Async
+        calls) so that many submissions can wait on the broker concurrently.
+
+        Args:
+            order: Order object (LimitOrder, MarketOrder, or IOCOrder)
+
+        Returns:
+            str: Broker's order ID
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.submit_order, order)
+
+    async def submit_orders_async(self, orders: List[om.Order]) -> List[str]:
+        """
+        Submit several orders concurrently.
+
+        Args:
+            orders: Order objects to submit
+
+        Returns:
+            list: Broker's order IDs, in the same order as orders
+        """
+        return list(await asyncio.gather(*(self.submit_order_async(order) for order in orders)))
+
     @abstractmethod
     def cancel_order(self, order_id: str) -> bool:
         """
@@ -154,96 +282,119 @@ class BrokerAdapter(ABC):
 # Uncomment and install alpaca-trade-api to use: pip install alpaca-trade-api
 
 class AlpacaBrokerAdapter(BrokerAdapter):
+    # Alpaca order type and time in force per internal order class
+    ORDER_TYPES = {om.MarketOrder: ('market', 'day'),
+                   om.LimitOrder: ('limit', 'day'),
+                   om.IOCOrder: ('limit', 'ioc')}
+
     def __init__(self, api_key: str, secret_key: str, base_url: str):
         import alpaca_trade_api as tradeapi
         self.api = tradeapi.REST(api_key, secret_key, base_url)
+        # trade_updates stream keeps the order status cache warm, so that
+        # get_order_status does not cost a REST round trip per call
+        self.stream = tradeapi.Stream(api_key, secret_key, base_url)
+        self.stream.subscribe_trade_updates(self._on_trade_update)
+        self._stream_thread = None
+        self._status_cache = {}  # Map order_id to latest status dict
         self.connected = False
 
     def connect(self) -> bool:
         try:
             self.api.get_account()
+            self._stream_thread = threading.Thread(target=self.stream.run, daemon=True)
+            self._stream_thread.start()
             self.connected = True
             return True
         except Exception as e:
-            print(f"Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             return False
 
     def disconnect(self) -> bool:
+        self.stream.stop()
         self.connected = False
         return True
 
+    @staticmethod
+    def _status_dict(order) -> Dict:
+        # Accepts both REST Order entities and the order mapping of a stream event
+        get = order.get if isinstance(order, dict) else functools.partial(getattr, order)
+        filled_qty = int(get('filled_qty') or 0)
+        avg_fill_price = get('filled_avg_price')
+        return {
+            'status': get('status'),
+            'filled_qty': filled_qty,
+            'remaining_qty': int(get('qty')) - filled_qty,
+            'avg_fill_price': float(avg_fill_price) if avg_fill_price else None,
+            'submitted_at': get('submitted_at'),
+            'filled_at': get('filled_at')
+        }
+
+    async def _on_trade_update(self, update):
+        order = update.order
+        self._status_cache[order['id']] = self._status_dict(order)
+        self.invalidate_cache()
+
     def submit_order(self, order: om.Order) -> str:
         if not self.connected:
             raise ConnectionError("Not connected to broker")
 
         # Map internal order types to Alpaca types
-        if isinstance(order, om.MarketOrder):
-            alpaca_order = self.api.submit_order(
-                symbol=order.symbol,
-                qty=order.quantity,
-                side='buy' if order.side == om.OrderSide.BUY else 'sell',
-                type='market',
-                time_in_force='day'
-            )
-        elif isinstance(order, om.LimitOrder):
-            alpaca_order = self.api.submit_order(
-                symbol=order.symbol,
-                qty=order.quantity,
-                side='buy' if order.side == om.OrderSide.BUY else 'sell',
-                type='limit',
-                limit_price=order.price,
-                time_in_force='day'
-            )
-        elif isinstance(order, om.IOCOrder):
-            alpaca_order = self.api.submit_order(
-                symbol=order.symbol,
-                qty=order.quantity,
-                side='buy' if order.side == om.OrderSide.BUY else 'sell',
-                type='limit',
-                limit_price=order.price,
-                time_in_force='ioc'
-            )
-        else:
+        try:
+            order_type, time_in_force = self.ORDER_TYPES[type(order)]
+        except KeyError:
             raise ValueError(f"Unsupported order type: {type(order)}")
 
+        alpaca_order = self.api.submit_order(
+            symbol=order.symbol,
+            qty=order.quantity,
+            side='buy' if order.side == om.OrderSide.BUY else 'sell',
+            type=order_type,
+            limit_price=order.price,  # None for market orders
+            time_in_force=time_in_force
+        )
+
+        # Seed the cache; the stream overwrites it as the order progresses
+        self._status_cache.setdefault(alpaca_order.id, self._status_dict(alpaca_order))
+        self.invalidate_cache()
         return alpaca_order.id
 
     def cancel_order(self, order_id: str) -> bool:
         try:
             self.api.cancel_order(order_id)
+            self.invalidate_cache()
             return True
         except Exception as e:
-            print(f"Cancel failed: {e}")
+            logger.warning("Cancel failed: %s", e)
             return False
 
     def modify_order(self, order_id: str, new_quantity: int) -> bool:
         try:
             self.api.replace_order(order_id, qty=new_quantity)
+            self.invalidate_cache()
             return True
         except Exception as e:
-            print(f"Modify failed: {e}")
+            logger.warning("Modify failed: %s", e)
             return False
 
     def get_order_status(self, order_id: str) -> Dict:
-        order = self.api.get_order(order_id)
-        return {
-            'status': order.status,
-            'filled_qty': int(order.filled_qty),
-            'remaining_qty': int(order.qty) - int(order.filled_qty),
-            'avg_fill_price': float(order.filled_avg_price) if order.filled_avg_price else None,
-            'submitted_at': order.submitted_at,
-            'filled_at': order.filled_at
-        }
+        status = self._status_cache.get(order_id)
+        if status is None:
+            # Orders placed outside this adapter are fetched once over REST
+            status = self._status_cache[order_id] = self._status_dict(
+                self.api.get_order(order_id))
+        return status
 
     def get_open_orders(self) -> List[Dict]:
         orders = self.api.list_orders(status='open')
         return [{'order_id': o.id, 'symbol': o.symbol, 'qty': o.qty,
                  'side': o.side, 'type': o.type} for o in orders]
 
+    @ttl_cache(1.0)
     def get_positions(self) -> Dict[str, int]:
         positions = self.api.list_positions()
         return {p.symbol: int(p.qty) for p in positions}
 
+    @ttl_cache(5.0)
     def get_account_info(self) -> Dict:
         account = self.api.get_account()
         return {
@@ -259,6 +410,11 @@ class AlpacaBrokerAdapter(BrokerAdapter):
 # Uncomment and install ib_insync to use: pip install ib_insync
 
 class InteractiveBrokersBrokerAdapter(BrokerAdapter):
+    # IB order type and time in force per internal order class
+    ORDER_TYPES = {om.MarketOrder: ('MKT', 'DAY'),
+                   om.LimitOrder: ('LMT', 'DAY'),
+                   om.IOCOrder: ('LMT', 'IOC')}
+
     def __init__(self, host: str = '127.0.0.1', port: int = 7497, client_id: int = 1):
         from ib_insync import IB
         self.ib = IB()
@@ -274,7 +430,7 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
             self.connected = True
             return True
         except Exception as e:
-            print(f"Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             return False
 
     def disconnect(self) -> bool:
@@ -296,19 +452,20 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
         # Map internal order to IB order
         action = 'BUY' if order.side == om.OrderSide.BUY else 'SELL'
 
-        if isinstance(order, om.MarketOrder):
-            ib_order = IBOrder(action, order.quantity, 'MKT')
-        elif isinstance(order, om.LimitOrder):
-            ib_order = IBOrder(action, order.quantity, 'LMT', lmtPrice=order.price)
-        elif isinstance(order, om.IOCOrder):
-            ib_order = IBOrder(action, order.quantity, 'LMT', lmtPrice=order.price)
-            ib_order.tif = 'IOC'
-        else:
+        try:
+            order_type, time_in_force = self.ORDER_TYPES[type(order)]
+        except KeyError:
             raise ValueError(f"Unsupported order type: {type(order)}")
 
+        ib_order = IBOrder(action, order.quantity, order_type)
+        if order.price is not None:
+            ib_order.lmtPrice = order.price
+        ib_order.tif = time_in_force
+
         # Submit order
         trade = self.ib.placeOrder(contract, ib_order)
         self.orders[trade.order.orderId] = trade
+        self.invalidate_cache()
 
         return str(trade.order.orderId)
 
@@ -317,10 +474,11 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
             trade = self.orders.get(int(order_id))
             if trade:
                 self.ib.cancelOrder(trade.order)
+                self.invalidate_cache()
                 return True
             return False
         except Exception as e:
-            print(f"Cancel failed: {e}")
+            logger.warning("Cancel failed: %s", e)
             return False
 
     def modify_order(self, order_id: str, new_quantity: int) -> bool:
@@ -329,13 +487,16 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
             if trade:
                 trade.order.totalQuantity = new_quantity
                 self.ib.placeOrder(trade.contract, trade.order)
+                self.invalidate_cache()
                 return True
             return False
         except Exception as e:
-            print(f"Modify failed: {e}")
+            logger.warning("Modify failed: %s", e)
             return False
 
     def get_order_status(self, order_id: str) -> Dict:
+        # ib_insync updates trade.orderStatus from the socket's orderStatus
+        # events, so this is an in-memory read rather than a request
         trade = self.orders.get(int(order_id))
         if not trade:
             return {'status': 'not_found'}
@@ -353,10 +514,12 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
                  'qty': t.order.totalQuantity, 'action': t.order.action}
                 for t in trades]
 
+    @ttl_cache(1.0)
     def get_positions(self) -> Dict[str, int]:
         positions = self.ib.positions()
         return {p.contract.symbol: int(p.position) for p in positions}
 
+    @ttl_cache(5.0)
     def get_account_info(self) -> Dict:
         account_values = self.ib.accountValues()
         info = {}
@@ -371,6 +534,24 @@ class InteractiveBrokersBrokerAdapter(BrokerAdapter):
 """
 
 
+class _OrderRecord:
+    """
+    Broker-side state of one simulated order.
+
+    Attributes:
+        order (om.Order): The submitted order
+        status (OrderStatus): Current status of the order
+        submitted_at (datetime): Submission time of the order, converted
+                                 on the first status request
+    """
+    __slots__ = ('order', 'status', 'submitted_at')
+
+    def __init__(self, order, status):
+        self.order = order
+        self.status = status
+        self.submitted_at = None
+
+
 class SimulatedBrokerAdapter(BrokerAdapter):
     """
     Simulated broker for paper trading and backtesting.
@@ -380,26 +561,30 @@ class SimulatedBrokerAdapter(BrokerAdapter):
     """
 
     def __init__(self):
-        """Initialize simulated broker with internal matching engine."""
-        self.engine = om.MatchingEngine()
+        """Initialize simulated broker; the matching engine is created on first use."""
         self.connected = False
         self.order_counter = 0
-        self.submitted_orders = {}  # Map order_id to order object
-        self.order_status = {}  # Map order_id to status
+        self.records = {}  # Map order_id to _OrderRecord
+        self.open_records = {}  # Map open order_ids to their records, in submission order
         self.positions = {}  # Map symbol to quantity
         self.cash = 100000.0  # Starting cash
         self.fills = []  # List of filled orders
 
+    @functools.cached_property
+    def engine(self) -> om.MatchingEngine:
+        """Internal matching engine, built the first time an order needs it."""
+        return om.MatchingEngine()
+
     def connect(self) -> bool:
         """Connect to simulated broker (always succeeds)."""
         self.connected = True
-        print("Connected to simulated broker")
+        logger.info("Connected to simulated broker")
         return True
 
     def disconnect(self) -> bool:
         """Disconnect from simulated broker."""
         self.connected = False
-        print("Disconnected from simulated broker")
+        logger.info("Disconnected from simulated broker")
         return True
 
     def submit_order(self, order: om.Order) -> str:
@@ -415,118 +600,236 @@ class SimulatedBrokerAdapter(BrokerAdapter):
         if not self.connected:
             raise ConnectionError("Not connected to broker")
 
+        order_id, filled_orders = self._execute(order)
+        self._apply_fills(filled_orders)
+        self.invalidate_cache()
+        return order_id
+
+    def batch_submit_orders(self, orders: List[om.Order]) -> List[str]:
+        """
+        Submit a basket of orders to simulated matching engine.
+
+        Orders are matched in sequence and their fills are booked into
+        positions and cash in one pass at the end of the basket.
+
+        Args:
+            orders: Order objects to submit
+
+        Returns:
+            list: Simulated order IDs, in the same order as orders
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to broker")
+
+        order_ids = []
+        filled_orders = []
+        for order in orders:
+            order_id, fills = self._execute(order)
+            order_ids.append(order_id)
+            filled_orders.extend(fills)
+        self._apply_fills(filled_orders)
+        self.invalidate_cache()
+        return order_ids
+
+    def _execute(self, order: om.Order):
+        """
+        Assign an order ID and run the order through the matching engine.
+
+        Args:
+            order: Order object to submit
+
+        Returns:
+            tuple: (order_id, fills); fills is empty if the order did not
+                   trade or was rejected
+        """
         # Generate order ID
         self.order_counter += 1
-        order_id = f"SIM{self.order_counter:06d}"
+        order_id = _SIM_ORDER_ID_PREFIX + str(self.order_counter).zfill(6)
 
         # Store order
-        self.submitted_orders[order_id] = order
-        self.order_status[order_id] = OrderStatus.SUBMITTED
+        record = self.records[order_id] = _OrderRecord(order, OrderStatus.SUBMITTED)
 
         # Submit to matching engine
         try:
             filled_orders = self.engine.handle_order(order)
+        except Exception as e:
+            record.status = OrderStatus.REJECTED
+            logger.warning("Order %s rejected: %s", order_id, e)
+            return order_id, []
 
-            # Process fills
-            if filled_orders:
-                self.order_status[order_id] = OrderStatus.FILLED
-                self.fills.extend(filled_orders)
+        if filled_orders:
+            record.status = OrderStatus.FILLED
+        else:
+            # Check if order is resting in book or was rejected
+            if isinstance(order, om.LimitOrder):
+                record.status = OrderStatus.PENDING
+            elif isinstance(order, om.IOCOrder):
+                record.status = OrderStatus.CANCELLED
 
-                # Update positions
-                for fill in filled_orders:
-                    qty_change = fill.quantity if fill.side == om.OrderSide.BUY else -fill.quantity
-                    self.positions[fill.symbol] = self.positions.get(fill.symbol, 0) + qty_change
+        if record.status in _OPEN_STATUSES:
+            self.open_records[order_id] = record
 
-                    # Update cash (simplified, doesn't account for commissions)
-                    cash_change = -fill.quantity * fill.price if fill.side == om.OrderSide.BUY else fill.quantity * fill.price
-                    self.cash += cash_change
-            else:
-                # Check if order is resting in book or was rejected
-                if isinstance(order, om.LimitOrder):
-                    self.order_status[order_id] = OrderStatus.PENDING
-                elif isinstance(order, om.IOCOrder):
-                    self.order_status[order_id] = OrderStatus.CANCELLED
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Order %s submitted: %s %s %s @ %s", order_id, order.symbol,
+                         order.side.name, order.quantity,
+                         'MARKET' if order.price is None else order.price)
 
-            print(f"Order {order_id} submitted: {order.symbol} {order.side.name} "
-                  f"{order.quantity} @ {getattr(order, 'price', 'MARKET')}")
+        return order_id, filled_orders
 
-            return order_id
+    def _apply_fills(self, filled_orders: List[om.FilledOrder]):
+        """
+        Book fills into the fill history, positions and cash.
 
-        except Exception as e:
-            self.order_status[order_id] = OrderStatus.REJECTED
-            print(f"Order {order_id} rejected: {e}")
-            return order_id
+        Args:
+            filled_orders: Fills returned by the matching engine
+        """
+        if not filled_orders:
+            return
+        self.fills.extend(filled_orders)
+
+        # Net the fills per symbol first, so that each symbol's position is
+        # updated once however many fills it had
+        buy = om.OrderSide.BUY
+        qty_changes = {}
+        cash_changes = []
+        for fill in filled_orders:
+            qty_change = fill.quantity if fill.side is buy else -fill.quantity
+            qty_changes[fill.symbol] = qty_changes.get(fill.symbol, 0) + qty_change
+            cash_changes.append(-qty_change * fill.price)
+
+        # Update positions
+        positions = self.positions
+        for symbol, qty_change in qty_changes.items():
+            positions[symbol] = positions.get(symbol, 0) + qty_change
+
+        # Update cash (simplified, doesn't account for commissions); fsum
+        # keeps long runs of fills from accumulating rounding error
+        self.cash += math.fsum(cash_changes)
+
+    async def submit_order_async(self, order: om.Order) -> str:
+        """
+        Submit order to simulated matching engine from a coroutine.
+
+        Matching is CPU-bound and the engine is not thread-safe, so the order
+        is handled inline rather than in an executor thread; orders gathered
+        by submit_orders_async are therefore matched in submission order.
+
+        Args:
+            order: Order object to submit
+
+        Returns:
+            str: Simulated order ID
+        """
+        return self.submit_order(order)
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order in the simulated broker."""
-        if order_id not in self.submitted_orders:
+        record = self.records.get(order_id)
+        if record is None:
             return False
 
-        order = self.submitted_orders[order_id]
-        success = self.engine.cancel_order(order.id)
+        success = self.engine.cancel_order(record.order.id)
 
         if success:
-            self.order_status[order_id] = OrderStatus.CANCELLED
-            print(f"Order {order_id} cancelled")
+            record.status = OrderStatus.CANCELLED
+            self.open_records.pop(order_id, None)
+            self.invalidate_cache()
+            logger.debug("Order %s cancelled", order_id)
             return True
 
         return False
 
     def modify_order(self, order_id: str, new_quantity: int) -> bool:
-        """Modify an order in the simulated broker."""
-        if order_id not in self.submitted_orders:
+        """Modify an order in the simulated broker; a quantity of zero cancels it."""
+        # The engine drops an order amended to zero, so its record is closed
+        # the same way as for an explicit cancel
+        if new_quantity == 0:
+            return self.cancel_order(order_id)
+
+        record = self.records.get(order_id)
+        if record is None:
             return False
 
-        order = self.submitted_orders[order_id]
         try:
-            self.engine.amend_quantity(order.id, new_quantity)
-            print(f"Order {order_id} modified to quantity {new_quantity}")
+            if not self.engine.amend_quantity(record.order.id, new_quantity):
+                return False
+            self.invalidate_cache()
+            logger.debug("Order %s modified to quantity %s", order_id, new_quantity)
             return True
         except Exception as e:
-            print(f"Modify failed: {e}")
+            logger.warning("Modify failed: %s", e)
             return False
 
     def get_order_status(self, order_id: str) -> Dict:
         """Get order status from simulated broker."""
-        if order_id not in self.submitted_orders:
+        record = self.records.get(order_id)
+        if record is None:
             return {'status': OrderStatus.REJECTED.value, 'error': 'Order not found'}
 
-        order = self.submitted_orders[order_id]
-        status = self.order_status.get(order_id, OrderStatus.PENDING)
+        order = record.order
+        status = record.status
 
         # Calculate filled quantity (simplified)
         filled_qty = order.quantity if status == OrderStatus.FILLED else 0
 
+        # order.time never changes, so it is converted once per order
+        submitted_at = record.submitted_at
+        if submitted_at is None:
+            submitted_at = record.submitted_at = datetime.fromtimestamp(order.time)
+
         return {
             'status': status.value,
             'filled_qty': filled_qty,
             'remaining_qty': order.quantity - filled_qty,
-            'avg_fill_price': getattr(order, 'price', None),
-            'submitted_at': datetime.fromtimestamp(order.time)
+            'avg_fill_price': order.price,
+            'submitted_at': submitted_at
         }
 
     def get_open_orders(self) -> List[Dict]:
         """Get all open orders in simulated broker."""
+        # Only the open orders are visited, not every order ever submitted
         open_orders = []
-        for order_id, status in self.order_status.items():
-            if status in [OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED]:
-                order = self.submitted_orders[order_id]
-                open_orders.append({
-                    'order_id': order_id,
-                    'symbol': order.symbol,
-                    'qty': order.quantity,
-                    'side': order.side.name,
-                    'type': order.type.name,
-                    'price': getattr(order, 'price', None)
-                })
+        for order_id, record in self.open_records.items():
+            order = record.order
+            open_orders.append({
+                'order_id': order_id,
+                'symbol': order.symbol,
+                'qty': order.quantity,
+                'side': order.side.name,
+                'type': order.type.name,
+                'price': order.price
+            })
         return open_orders
 
+    def iter_open_orders(self) -> Iterator[OpenOrderView]:
+        """
+        Iterate over the open orders in simulated broker as lightweight views.
+
+        Yields the same fields as get_open_orders, as namedtuples instead of
+        dicts, for callers that only read them. Orders must not be cancelled
+        while the iterator is being consumed.
+
+        Yields:
+            OpenOrderView: One view per open order, in submission order
+        """
+        for order_id, record in self.open_records.items():
+            order = record.order
+            yield OpenOrderView(order_id, order.symbol, order.quantity,
+                                order.side.name, order.type.name, order.price)
+
+    @ttl_cache(1.0)
     def get_positions(self) -> Dict[str, int]:
-        """Get current positions in simulated broker."""
+        """
+        Get current positions in simulated broker.
+
+        The copy is cached until the next order event, so repeated polls
+        share one dict, which callers must not mutate.
+        """
         return self.positions.copy()
 
+    @ttl_cache(5.0)
     def get_account_info(self) -> Dict:
-        """Get account information from simulated broker."""
+        """Get account information from simulated broker, cached until the next order event."""
         # Calculate portfolio value (simplified)
         portfolio_value = self.cash
         # In a real implementation, would need current market prices to value positions
@@ -541,6 +844,347 @@ class SimulatedBrokerAdapter(BrokerAdapter):
         }
 
 
+class BatchingBrokerAdapter(BrokerAdapter):
+    """
+    Wrapper that coalesces asynchronous order submissions into baskets.
+
+    Orders passed to submit_order_async within interval_ms of the first
+    waiting order are sent to the wrapped adapter with a single
+    batch_submit_orders call, or as soon as max_batch orders are waiting.
+    Limit orders and immediate orders (market and IOC) are collected in
+    separate baskets, so immediate orders never wait for the limit basket's
+    timer; a flushed basket takes along the orders of the other kind that
+    were queued before its last order, so orders still reach the broker in
+    the order they were submitted. Orders whose await was cancelled before
+    their basket was flushed are dropped.
+
+    Every call to the wrapped adapter, baskets and the synchronous methods
+    alike, runs on a single worker thread, one at a time and in the order it
+    was made, so a slow broker round trip never blocks the event loop and
+    the wrapped adapter only ever sees one thread. disconnect stops the
+    worker; waiting orders fail with ConnectionError and later calls raise
+    RuntimeError.
+    """
+
+    def __init__(self, wrapped: BrokerAdapter, interval_ms: float = 10, max_batch: int = 15):
+        """
+        Initialize the batching wrapper.
+
+        Args:
+            wrapped: Adapter that receives the baskets
+            interval_ms: Longest time an order waits for its basket to fill
+            max_batch: Basket size that triggers an immediate flush
+        """
+        self.wrapped = wrapped
+        self.interval = interval_ms / 1000.0
+        self.max_batch = max_batch
+        self._pending = {}  # Map basket key to list of (seq, order, future)
+        self._timers = {}  # Map basket key to its scheduled flush
+        self._tasks = set()  # Basket submissions in flight
+        self._seq = itertools.count()  # Arrival order of queued orders
+        self._closed = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='broker-batch')
+
+    def _call(self, method, *args):
+        """Run a call on the worker thread and wait for its result."""
+        return self._executor.submit(method, *args).result()
+
+    # Everything but asynchronous submission is delegated unchanged
+
+    def connect(self) -> bool:
+        return self._call(self.wrapped.connect)
+
+    def disconnect(self) -> bool:
+        """
+        Disconnect the wrapped adapter and stop the worker thread.
+
+        Baskets already flushed are submitted first; orders still waiting
+        for their basket fail with ConnectionError.
+        """
+        if self._closed:
+            return True
+        self._closed = True
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for pending in self._pending.values():
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(ConnectionError("Broker adapter disconnected"))
+        self._pending.clear()
+        try:
+            return self._call(self.wrapped.disconnect)
+        finally:
+            self._executor.shutdown()
+
+    def submit_order(self, order: om.Order) -> str:
+        return self._call(self.wrapped.submit_order, order)
+
+    def batch_submit_orders(self, orders: List[om.Order]) -> List[str]:
+        return self._call(self.wrapped.batch_submit_orders, orders)
+
+    def cancel_order(self, order_id: str) -> bool:
+        return self._call(self.wrapped.cancel_order, order_id)
+
+    def batch_cancel_orders(self, order_ids: List[str]) -> List[bool]:
+        return self._call(self.wrapped.batch_cancel_orders, order_ids)
+
+    def modify_order(self, order_id: str, new_quantity: int) -> bool:
+        return self._call(self.wrapped.modify_order, order_id, new_quantity)
+
+    def get_order_status(self, order_id: str) -> Dict:
+        return self._call(self.wrapped.get_order_status, order_id)
+
+    def get_open_orders(self) -> List[Dict]:
+        return self._call(self.wrapped.get_open_orders)
+
+    def get_positions(self) -> Dict[str, int]:
+        return self._call(self.wrapped.get_positions)
+
+    def get_account_info(self) -> Dict:
+        return self._call(self.wrapped.get_account_info)
+
+    async def submit_order_async(self, order: om.Order) -> str:
+        """
+        Queue an order for the next basket of its kind.
+
+        Args:
+            order: Order object to submit
+
+        Returns:
+            str: Broker's order ID, once the basket has been submitted
+
+        Raises:
+            RuntimeError: If the adapter has been disconnected
+        """
+        if self._closed:
+            raise RuntimeError("Broker adapter worker has been closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = isinstance(order, om.LimitOrder)
+        pending = self._pending.setdefault(key, [])
+        pending.append((next(self._seq), order, future))
+
+        if len(pending) >= self.max_batch:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.interval, self._flush, key)
+
+        return await future
+
+    def _take(self, key: bool, before=None) -> list:
+        """
+        Remove waiting orders from a basket.
+
+        Args:
+            key: Basket to take from (True for limit orders)
+            before: Only take orders queued before this sequence number;
+                    None takes the whole basket
+
+        Returns:
+            list: (seq, order, future) entries taken, in arrival order
+        """
+        pending = self._pending.get(key)
+        if not pending:
+            return []
+        if before is not None:
+            count = 0
+            while count < len(pending) and pending[count][0] < before:
+                count += 1
+            taken = pending[:count]
+            del pending[:count]
+            if pending:
+                return taken
+        else:
+            taken = pending
+        del self._pending[key]
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        return taken
+
+    def _flush(self, key: bool):
+        """
+        Take the waiting basket and start its submission.
+
+        Args:
+            key: Basket to flush (True for limit orders)
+        """
+        pending = self._take(key)
+        if not pending:
+            return
+        # Earlier orders of the other kind go first, so that nothing flushed
+        # here overtakes an order submitted before it
+        earlier = self._take(not key, before=pending[-1][0])
+        if earlier:
+            pending = sorted(earlier + pending, key=lambda entry: entry[0])
+        pending = [entry for entry in pending if not entry[2].cancelled()]
+        if not pending:
+            return
+
+        # The basket is queued on the worker here rather than in the task,
+        # so that baskets reach the broker in the order they were flushed
+        loop = asyncio.get_running_loop()
+        order_ids = loop.run_in_executor(
+            self._executor, self.wrapped.batch_submit_orders,
+            [order for _, order, _ in pending])
+        task = loop.create_task(self._submit_basket(pending, order_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _submit_basket(self, pending: list, order_ids: asyncio.Future):
+        """
+        Wait for a basket's submission and hand each order its ID.
+
+        Args:
+            pending: (seq, order, future) entries of the basket
+            order_ids: Resolves to the IDs returned by the wrapped adapter
+        """
+        try:
+            order_ids = await order_ids
+            if len(order_ids) != len(pending):
+                raise RuntimeError(f"Broker returned {len(order_ids)} order IDs "
+                                   f"for a basket of {len(pending)} orders")
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), order_id in zip(pending, order_ids):
+            if not future.done():
+                future.set_result(order_id)
+
+
+class SingleThreadBrokerAdapter(BrokerAdapter):
+    """
+    Wrapper that runs every call of an adapter on one dedicated thread.
+
+    Adapters such as SimulatedBrokerAdapter and its MatchingEngine are not
+    thread-safe. When several strategy threads share one, they hand their
+    calls to the worker thread through a queue and wait on a future; the
+    worker runs the calls one after another, so the wrapped adapter only
+    ever sees a single thread and needs no locking. Coroutines await the
+    future without blocking their event loop.
+
+    disconnect (or close) stops the worker once the calls queued before it
+    have run; later calls raise RuntimeError.
+    """
+
+    def __init__(self, wrapped: BrokerAdapter):
+        """
+        Initialize the wrapper and start its worker thread.
+
+        Args:
+            wrapped: Adapter to confine to the worker thread
+        """
+        self.wrapped = wrapped
+        self._inbox = queue.SimpleQueue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name='broker-adapter', daemon=True)
+        self._worker.start()
+
+    def _run(self):
+        """Worker loop: run queued calls in arrival order until the stop sentinel."""
+        while True:
+            item = self._inbox.get()
+            if item is None:
+                return
+            future, method, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(method(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def close(self):
+        """
+        Stop the worker thread after the calls already queued have run.
+
+        Safe to call more than once; calls made afterwards raise RuntimeError.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._inbox.put(None)
+        if threading.current_thread() is not self._worker:
+            self._worker.join()
+
+    def _submit(self, method, *args) -> concurrent.futures.Future:
+        """
+        Queue a call for the worker thread.
+
+        Args:
+            method: Bound method of the wrapped adapter
+            *args: Arguments of the call
+
+        Returns:
+            concurrent.futures.Future: Resolves to the call's result
+        """
+        future = concurrent.futures.Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("Broker adapter worker has been closed")
+            self._inbox.put((future, method, args))
+        return future
+
+    def _call(self, method, *args):
+        """Run a call on the worker thread and wait for its result."""
+        return self._submit(method, *args).result()
+
+    def connect(self) -> bool:
+        return self._call(self.wrapped.connect)
+
+    def disconnect(self) -> bool:
+        try:
+            return self._call(self.wrapped.disconnect)
+        finally:
+            self.close()
+
+    def submit_order(self, order: om.Order) -> str:
+        return self._call(self.wrapped.submit_order, order)
+
+    def batch_submit_orders(self, orders: List[om.Order]) -> List[str]:
+        return self._call(self.wrapped.batch_submit_orders, orders)
+
+    def cancel_order(self, order_id: str) -> bool:
+        return self._call(self.wrapped.cancel_order, order_id)
+
+    def batch_cancel_orders(self, order_ids: List[str]) -> List[bool]:
+        return self._call(self.wrapped.batch_cancel_orders, order_ids)
+
+    def modify_order(self, order_id: str, new_quantity: int) -> bool:
+        return self._call(self.wrapped.modify_order, order_id, new_quantity)
+
+    def get_order_status(self, order_id: str) -> Dict:
+        return self._call(self.wrapped.get_order_status, order_id)
+
+    def get_open_orders(self) -> List[Dict]:
+        return self._call(self.wrapped.get_open_orders)
+
+    def get_positions(self) -> Dict[str, int]:
+        return self._call(self.wrapped.get_positions)
+
+    def get_account_info(self) -> Dict:
+        return self._call(self.wrapped.get_account_info)
+
+    async def submit_order_async(self, order: om.Order) -> str:
+        """
+        Queue an order for the worker thread and await its ID.
+
+        Args:
+            order: Order object to submit
+
+        Returns:
+            str: Broker's order ID
+        """
+        return await asyncio.wrap_future(self._submit(self.wrapped.submit_order, order))
+
+
 # =============================================================================
 # FACTORY FUNCTION
 # =============================================================================
@@ -10,9 +10,11 @@ Future Implementation: Add concrete adapters for real-time market data APIs
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime
+import _trade_data_management as tdm
 
 
 class MarketDataAdapter(ABC):
@@ -110,18 +112,36 @@ class MarketDataAdapter(ABC):
 
 """
 # Example: Alpaca Market Data Adapter
-# Uncomment and install alpaca-trade-api to use: pip install alpaca-trade-api
+# Uncomment and install requests to use: pip install requests
 
 class AlpacaDataAdapter(MarketDataAdapter):
-    def __init__(self, api_key: str, secret_key: str, base_url: str):
-        import alpaca_trade_api as tradeapi
-        self.api = tradeapi.REST(api_key, secret_key, base_url)
+    # Market data is served from its own host; account calls go to base_url
+    DATA_URL = 'https://data.alpaca.markets/v2'
+
+    def __init__(self, api_key: str, secret_key: str, base_url: str,
+                 timeout: float = 2.0, pool_size: int = 20):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.base_url = base_url
+        self.timeout = timeout
+        # One session for the adapter's lifetime: its pool keeps connections
+        # alive, so quotes and bars reuse them instead of paying a TCP/TLS
+        # handshake per call
+        self.session = requests.Session()
+        self.session.headers.update({'APCA-API-KEY-ID': api_key,
+                                     'APCA-API-SECRET-KEY': secret_key})
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
         self.connected = False
 
+    def _get(self, url: str, **params) -> Dict:
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
     def connect(self) -> bool:
         try:
             # Test connection
-            self.api.get_account()
+            self._get(f'{self.base_url}/v2/account')
             self.connected = True
             return True
         except Exception as e:
@@ -129,17 +149,18 @@ class AlpacaDataAdapter(MarketDataAdapter):
             return False
 
     def disconnect(self) -> bool:
+        self.session.close()  # Release the pooled connections
         self.connected = False
         return True
 
     def get_stock_quote(self, symbol: str) -> Dict:
-        quote = self.api.get_latest_quote(symbol)
+        quote = self._get(f'{self.DATA_URL}/stocks/{symbol}/quotes/latest')['quote']
         return {
-            'bid_price': quote.bp,
-            'bid_volume': quote.bs,
-            'ask_price': quote.ap,
-            'ask_volume': quote.as_,
-            'timestamp': quote.t
+            'bid_price': quote['bp'],
+            'bid_volume': quote['bs'],
+            'ask_price': quote['ap'],
+            'ask_volume': quote['as'],
+            'timestamp': quote['t']
         }
 
     def get_options_chain(self, symbol: str, expiration_date: str) -> pd.DataFrame:
@@ -148,8 +169,9 @@ class AlpacaDataAdapter(MarketDataAdapter):
 
     def get_historical_data(self, symbol: str, start_date: str, end_date: str,
                            timeframe: str = '1Min') -> pd.DataFrame:
-        barset = self.api.get_bars(symbol, timeframe, start=start_date, end=end_date)
-        df = barset.df
+        bars = self._get(f'{self.DATA_URL}/stocks/{symbol}/bars',
+                         timeframe=timeframe, start=start_date, end=end_date)['bars']
+        df = pd.DataFrame(bars or [])
         return df
 
     def subscribe_realtime(self, symbols: List[str], callback) -> bool:
@@ -236,49 +258,57 @@ class InteractiveBrokersDataAdapter(MarketDataAdapter):
 
 """
 # Example: Polygon.io Data Adapter
-# Uncomment and install polygon to use: pip install polygon-api-client
+# Uncomment and install requests to use: pip install requests
 
 class PolygonDataAdapter(MarketDataAdapter):
-    def __init__(self, api_key: str):
-        from polygon import RESTClient
-        self.client = RESTClient(api_key)
+    BASE_URL = 'https://api.polygon.io'
+
+    def __init__(self, api_key: str, timeout: float = 2.0, pool_size: int = 20):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.timeout = timeout
+        # One session for the adapter's lifetime: its pool keeps connections
+        # alive, so calls reuse them instead of reconnecting
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {api_key}'
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
         self.connected = True  # REST API doesn't require explicit connection
 
+    def _get(self, path: str, **params) -> Dict:
+        response = self.session.get(self.BASE_URL + path, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
     def connect(self) -> bool:
         return True
 
     def disconnect(self) -> bool:
+        self.session.close()  # Release the pooled connections
         return True
 
     def get_stock_quote(self, symbol: str) -> Dict:
-        quote = self.client.get_last_quote(symbol)
+        quote = self._get(f'/v2/last/nbbo/{symbol}')['results']
         return {
-            'bid_price': quote.bid_price,
-            'bid_volume': quote.bid_size,
-            'ask_price': quote.ask_price,
-            'ask_volume': quote.ask_size,
-            'timestamp': quote.sip_timestamp
+            'bid_price': quote['p'],
+            'bid_volume': quote['s'],
+            'ask_price': quote['P'],
+            'ask_volume': quote['S'],
+            'timestamp': quote['t']
         }
 
     def get_options_chain(self, symbol: str, expiration_date: str) -> pd.DataFrame:
         # Use Polygon's options API
-        contracts = self.client.list_options_contracts(
-            underlying_ticker=symbol,
-            expiration_date=expiration_date
-        )
+        contracts = self._get('/v3/reference/options/contracts',
+                              underlying_ticker=symbol,
+                              expiration_date=expiration_date)['results']
         # Process and return as DataFrame
         pass
 
     def get_historical_data(self, symbol: str, start_date: str, end_date: str,
                            timeframe: str = '1Min') -> pd.DataFrame:
-        bars = self.client.get_aggs(
-            symbol,
-            1,
-            'minute' if 'Min' in timeframe else 'day',
-            start_date,
-            end_date
-        )
-        df = pd.DataFrame(bars)
+        timespan = 'minute' if 'Min' in timeframe else 'day'
+        bars = self._get(f'/v2/aggs/ticker/{symbol}/range/1/{timespan}/{start_date}/{end_date}')
+        df = pd.DataFrame(bars.get('results', []))
         return df
 
     def subscribe_realtime(self, symbols: List[str], callback) -> bool:
@@ -300,16 +330,31 @@ class CSVDataAdapter(MarketDataAdapter):
         Initialize CSV data adapter.
 
         Args:
-            filename: Path to CSV file containing market data
+            filename: Path to CSV file containing market data, or an open
+                      file or buffer
         """
         self.filename = filename
         self.data = None
         self.connected = False
+        self._values = None  # self.data as an array
+        self._quote_locs = None  # Positions of the stock quote columns (None if absent)
+        self._timestamps = None  # Parsed index as datetime64 values, in time order, on first use
+        self._time_order = None  # Row positions in time order, None if already sorted
+        self._option_cols = None  # Put and call columns, found once at connect()
 
     def connect(self) -> bool:
         """Load data from CSV file."""
         try:
-            self.data = pd.read_csv(self.filename, index_col=0)
+            # Same reader as the backtest's read_data
+            self.data = tdm.read_market_csv(self.filename)
+            self._values = self.data.to_numpy()
+            self._timestamps = None
+            self._time_order = None
+            self._quote_locs = tuple(
+                self.data.columns.get_loc(col) if col in self.data.columns else None
+                for col in ('BidPrice-Stock', 'BidVolume-Stock', 'AskPrice-Stock', 'AskVolume-Stock'))
+            self._option_cols = [col for col in self.data.columns
+                                 if '-P' in col or '-C' in col]
             self.connected = True
             return True
         except Exception as e:
@@ -319,9 +364,35 @@ class CSVDataAdapter(MarketDataAdapter):
     def disconnect(self) -> bool:
         """Clear loaded data."""
         self.data = None
+        self._values = None
+        self._quote_locs = None
+        self._timestamps = None
+        self._time_order = None
+        self._option_cols = None
         self.connected = False
         return True
 
+    def _time_index(self) -> np.ndarray:
+        """
+        Parse the index as timestamps and put them in time order, once.
+
+        Parsing waits for the first date query, so files whose index is not
+        a date still load.
+
+        Returns:
+            np.ndarray: Index as datetime64 values, in time order
+
+        Raises:
+            ValueError: If the index cannot be parsed as dates
+        """
+        if self._timestamps is None:
+            timestamps = pd.to_datetime(self.data.index).values
+            if not (timestamps[1:] >= timestamps[:-1]).all():
+                self._time_order = np.argsort(timestamps, kind='stable')
+                timestamps = timestamps[self._time_order]
+            self._timestamps = timestamps
+        return self._timestamps
+
     def get_stock_quote(self, symbol: str) -> Dict:
         """
         Get stock quote from CSV data (returns first row).
@@ -331,15 +402,16 @@ class CSVDataAdapter(MarketDataAdapter):
         if self.data is None or not self.connected:
             raise ConnectionError("Not connected. Call connect() first.")
 
-        # Extract stock columns
-        stock_cols = [col for col in self.data.columns if 'Stock' in col]
-        first_row = self.data[stock_cols].iloc[0]
+        # Read the stock columns straight from the first row of the array
+        first_row = self._values[0]
+        bid_price, bid_volume, ask_price, ask_volume = (
+            0 if loc is None else first_row[loc] for loc in self._quote_locs)
 
         return {
-            'bid_price': first_row.get('BidPrice-Stock', 0),
-            'bid_volume': first_row.get('BidVolume-Stock', 0),
-            'ask_price': first_row.get('AskPrice-Stock', 0),
-            'ask_volume': first_row.get('AskVolume-Stock', 0),
+            'bid_price': bid_price,
+            'bid_volume': bid_volume,
+            'ask_price': ask_price,
+            'ask_volume': ask_volume,
             'timestamp': self.data.index[0]
         }
 
@@ -353,21 +425,49 @@ class CSVDataAdapter(MarketDataAdapter):
             raise ConnectionError("Not connected. Call connect() first.")
 
         # Extract option columns
-        option_cols = [col for col in self.data.columns
-                      if '-P' in col or '-C' in col]
-        return self.data[option_cols]
+        return self.data[self._option_cols]
 
     def get_historical_data(self, symbol: str, start_date: str, end_date: str,
                            timeframe: str = '1Min') -> pd.DataFrame:
         """
         Get historical data from CSV file.
 
-        Returns all data from the CSV file (date filtering not implemented).
+        Returns the rows from start_date through end_date, both inclusive,
+        in time order; either bound may be None to leave that side open.
+        Bounds are compared as full timestamps, except that an end_date at
+        midnight (e.g. '2024-01-02') covers that whole day. The file holds a
+        single underlying, so symbol is not used, and rows are returned at
+        the file's own frequency regardless of timeframe. A file whose index
+        is not a date can only be read whole, with both bounds None.
         """
         if self.data is None or not self.connected:
             raise ConnectionError("Not connected. Call connect() first.")
 
-        return self.data.copy()
+        # The timestamps are parsed and put in time order once, on the first
+        # call, so the date range is located by binary search and only that
+        # window is copied
+        try:
+            timestamps = self._time_index()
+        except (ValueError, TypeError):
+            if start_date is None and end_date is None:
+                return self.data.copy()
+            raise
+        lo, hi = 0, len(timestamps)
+        if start_date is not None:
+            start = pd.Timestamp(start_date).to_datetime64()
+            lo = np.searchsorted(timestamps, start, side='left')
+        if end_date is not None:
+            end = pd.Timestamp(end_date)
+            if end == end.normalize():
+                # A date without a time of day means the whole day
+                hi = np.searchsorted(timestamps,
+                                     (end + pd.Timedelta(days=1)).to_datetime64(), side='left')
+            else:
+                hi = np.searchsorted(timestamps, end.to_datetime64(), side='right')
+
+        if self._time_order is None:
+            return self.data.iloc[lo:hi].copy()
+        return self.data.iloc[self._time_order[lo:hi]]
 
     def subscribe_realtime(self, symbols: List[str], callback) -> bool:
         """
@@ -5,6 +5,9 @@ This script demonstrates how to use the order matching engine to simulate
 order book dynamics and trade execution.
 """
 
+import contextlib
+import io
+import logging
 import time
 import sys
 sys.path.append('..')  # Add parent directory to path
@@ -17,6 +20,9 @@ from _order_management import (
     OrderSide
 )
 
+# Bound formatter for the per-row price columns of the book printouts
+_money = "${:.2f}".format
+
 
 def main():
     print("=" * 70)
@@ -33,10 +39,13 @@ def main():
     print("--- Example 1: Building the order book ---")
     print()
 
+    # One timestamp for the batch; orders at a price are queued in arrival
+    # order, so they need no per-order clock read to keep time priority
+    now = time.time()
     buy_orders = [
-        LimitOrder(1, "AAPL", 100, 150.50, OrderSide.BUY, time.time()),
-        LimitOrder(2, "AAPL", 200, 150.25, OrderSide.BUY, time.time()),
-        LimitOrder(3, "AAPL", 150, 150.00, OrderSide.BUY, time.time()),
+        LimitOrder(1, "AAPL", 100, 150.50, OrderSide.BUY, now),
+        LimitOrder(2, "AAPL", 200, 150.25, OrderSide.BUY, now),
+        LimitOrder(3, "AAPL", 150, 150.00, OrderSide.BUY, now),
     ]
 
     for order in buy_orders:
@@ -52,10 +61,11 @@ def main():
     print("--- Example 2: Adding sell orders (no match) ---")
     print()
 
+    now = time.time()
     sell_orders = [
-        LimitOrder(4, "AAPL", 100, 151.00, OrderSide.SELL, time.time()),
-        LimitOrder(5, "AAPL", 150, 151.25, OrderSide.SELL, time.time()),
-        LimitOrder(6, "AAPL", 200, 151.50, OrderSide.SELL, time.time()),
+        LimitOrder(4, "AAPL", 100, 151.00, OrderSide.SELL, now),
+        LimitOrder(5, "AAPL", 150, 151.25, OrderSide.SELL, now),
+        LimitOrder(6, "AAPL", 200, 151.50, OrderSide.SELL, now),
     ]
 
     for order in sell_orders:
@@ -71,14 +81,14 @@ def main():
     print("--- Current Order Books ---")
     print()
     print("BID BOOK (sorted by price desc, time asc):")
-    for i, order in enumerate(engine.bid_book[:5], 1):
-        print(f"  {i}. ID={order.id}, Price=${order.price:.2f}, "
+    for i, order in enumerate(engine.top_bids(5), 1):
+        print(f"  {i}. ID={order.id}, Price={_money(order.price)}, "
               f"Qty={order.quantity}, Side={order.side.name}")
 
     print()
-    print("ASK BOOK (sorted by price asc, time desc):")
-    for i, order in enumerate(engine.ask_book[:5], 1):
-        print(f"  {i}. ID={order.id}, Price=${order.price:.2f}, "
+    print("ASK BOOK (sorted by price asc, time asc):")
+    for i, order in enumerate(engine.top_asks(5), 1):
+        print(f"  {i}. ID={order.id}, Price={_money(order.price)}, "
               f"Qty={order.quantity}, Side={order.side.name}")
     print()
 
@@ -93,7 +103,7 @@ def main():
 
     print(f"✓ Market order executed, {len(filled_orders)} fills")
     for fill in filled_orders:
-        print(f"  - Filled {fill.quantity} @ ${fill.price:.2f}")
+        print(f"  - Filled {fill.quantity} @ {_money(fill.price)}")
 
     print()
     print(f"Ask book depth after market order: {len(engine.ask_book)} orders")
@@ -113,7 +123,7 @@ def main():
 
     if filled_orders:
         print(f"✓ Order partially filled, {len(filled_orders)} executions")
-        total_filled = sum(f.quantity for f in filled_orders if f.id == crossing_order.id)
+        total_filled = filled_orders.total_filled
         print(f"  Total filled: {total_filled} shares")
         print(f"  Remaining: {crossing_order.quantity} shares (now in bid book)")
     else:
@@ -134,7 +144,7 @@ def main():
     filled_orders = engine.handle_ioc_order(ioc_order)
 
     if filled_orders:
-        total_filled = sum(f.quantity for f in filled_orders if f.id == ioc_order.id)
+        total_filled = filled_orders.total_filled
         print(f"✓ IOC order filled: {total_filled} shares")
         print(f"  Cancelled: {ioc_order.quantity} shares")
     else:
@@ -197,4 +207,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect the report and write it to the terminal in one go rather than
+    # flushing it line by line
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            # Log messages go into the same report, in order with the prints
+            logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+            main()
+    finally:
+        sys.stdout.write(out.getvalue())
@@ -5,12 +5,19 @@ This script demonstrates how to use the simulated broker adapter for
 paper trading and testing strategies without risking real money.
 """
 
+import contextlib
+import io
+import logging
 import time
 import sys
 sys.path.append('..')  # Add parent directory to path
 
 from _order_management import LimitOrder, MarketOrder, OrderSide
-from broker_adapters import create_broker_adapter
+from broker_adapters import OrderStatus, create_broker_adapter
+
+# Display label of each status value, built once instead of upper-casing
+# the status string on every print
+_STATUS_LABELS = {status.value: status.name for status in OrderStatus}
 
 
 def main():
@@ -37,32 +44,29 @@ def main():
     print("--- Submitting Orders ---")
     print()
 
-    orders = []
+    # One timestamp for the basket; orders are queued in arrival order
+    now = time.time()
 
     # Order 1: Buy limit order
-    order1 = LimitOrder(1, "AAPL", 100, 150.00, OrderSide.BUY, time.time())
-    order_id1 = broker.submit_order(order1)
-    orders.append(order_id1)
-    print(f"Order 1: {order_id1}")
+    order1 = LimitOrder(1, "AAPL", 100, 150.00, OrderSide.BUY, now)
 
     # Order 2: Another buy limit order at different price
-    order2 = LimitOrder(2, "AAPL", 50, 149.50, OrderSide.BUY, time.time())
-    order_id2 = broker.submit_order(order2)
-    orders.append(order_id2)
-    print(f"Order 2: {order_id2}")
+    order2 = LimitOrder(2, "AAPL", 50, 149.50, OrderSide.BUY, now)
 
     # Order 3: Sell limit order (will match if crossed)
-    order3 = LimitOrder(3, "AAPL", 75, 150.50, OrderSide.SELL, time.time())
-    order_id3 = broker.submit_order(order3)
-    orders.append(order_id3)
-    print(f"Order 3: {order_id3}")
+    order3 = LimitOrder(3, "AAPL", 75, 150.50, OrderSide.SELL, now)
+
+    # Submit the three orders as one basket; they are matched in sequence
+    orders = broker.batch_submit_orders([order1, order2, order3])
+    for i, order_id in enumerate(orders, 1):
+        print(f"Order {i}: {order_id}")
     print()
 
     # Check order statuses
     print("--- Order Statuses ---")
     for order_id in orders:
         status = broker.get_order_status(order_id)
-        print(f"{order_id}: {status['status'].upper()}")
+        print(f"{order_id}: {_STATUS_LABELS[status['status']]}")
         if status['filled_qty'] > 0:
             print(f"  Filled: {status['filled_qty']} @ ${status['avg_fill_price']:.2f}")
     print()
@@ -75,7 +79,7 @@ def main():
     print()
 
     status = broker.get_order_status(order_id4)
-    print(f"Status: {status['status'].upper()}")
+    print(f"Status: {_STATUS_LABELS[status['status']]}")
     if status['filled_qty'] > 0:
         print(f"Filled: {status['filled_qty']} shares @ ${status['avg_fill_price']:.2f}")
     print()
@@ -93,11 +97,11 @@ def main():
 
     # View open orders
     print("--- Open Orders ---")
-    open_orders = broker.get_open_orders()
+    open_orders = list(broker.iter_open_orders())
     if open_orders:
         for order in open_orders:
-            print(f"Order {order['order_id']}: {order['symbol']} "
-                  f"{order['side']} {order['qty']} @ {order['price']}")
+            print(f"Order {order.order_id}: {order.symbol} "
+                  f"{order.side} {order.qty} @ {order.price}")
     else:
         print("No open orders")
     print()
@@ -106,8 +110,8 @@ def main():
     print("--- Modifying Order ---")
     if open_orders:
         first_order = open_orders[0]
-        order_id = first_order['order_id']
-        original_qty = first_order['qty']
+        order_id = first_order.order_id
+        original_qty = first_order.qty
         new_qty = original_qty // 2
 
         print(f"Modifying {order_id}: {original_qty} → {new_qty} shares")
@@ -123,7 +127,7 @@ def main():
     print("--- Cancelling Order ---")
     if open_orders:
         last_order = open_orders[-1]
-        order_id = last_order['order_id']
+        order_id = last_order.order_id
 
         print(f"Cancelling {order_id}")
         success = broker.cancel_order(order_id)
@@ -158,11 +162,21 @@ def main():
 
     # Disconnect
     broker.disconnect()
-    print("Disconnected from simulated broker")
     print()
     print("Example complete!")
     print()
 
 
 if __name__ == "__main__":
-    main()
+    # Collect the report and write it to the terminal in one go rather than
+    # flushing it line by line
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            # Log messages go into the same report, in order with the prints
+            logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+            # Also show the adapter's per-order messages, logged at DEBUG
+            logging.getLogger('broker_adapters').setLevel(logging.DEBUG)
+            main()
+    finally:
+        sys.stdout.write(out.getvalue())
@@ -1,7 +1,10 @@
     
+import asyncio
 import unittest
+import unittest.mock
 import io
 import __main__
+import broker_adapters
 
 data_string = """Time,BidPrice-Stock,BidVolume-Stock,AskPrice-Stock,AskVolume-Stock,TimeToExpiry,BidPrice-P60,BidVolume-P60,AskPrice-P60,AskVolume-P60,BidPrice-P70,BidVolume-P70,AskPrice-P70,AskVolume-P70,BidPrice-P80,BidVolume-P80,AskPrice-P80,AskVolume-P80,BidPrice-C60,BidVolume-C60,AskPrice-C60,AskVolume-C60,BidPrice-C70,BidVolume-C70,AskPrice-C70,AskVolume-C70,BidPrice-C80,BidVolume-C80,AskPrice-C80,AskVolume-C80
 2018-01-01 00:05:00,70.7,120.0,70.9,120.0,0.911624809741248,1.3,20.0,1.35,20.0,4.92,20.0,5.0200000000000005,20.0,11.42,20.0,11.53,20.0,12.06,20.0,12.17,20.0,5.71,20.0,5.8100000000000005,20.0,2.22,20.0,2.3000000000000003,20.0
@@ -91,7 +94,26 @@ class TestOrderBook(unittest.TestCase):
 
         self.assertEqual(matching_engine.bid_book[0].quantity, 10)
         self.assertEqual(matching_engine.bid_book[0].price, 10)
-    
+
+    def test_insert_limit_order_priority(self):
+        matching_engine = MatchingEngine()
+        matching_engine.insert_limit_order(LimitOrder(1, "S", 10, 12, OrderSide.SELL, time.time()))
+        matching_engine.insert_limit_order(LimitOrder(2, "S", 10, 11, OrderSide.SELL, time.time()))
+        matching_engine.insert_limit_order(LimitOrder(3, "S", 10, 11, OrderSide.SELL, time.time()))
+        matching_engine.insert_limit_order(LimitOrder(4, "S", 10, 9, OrderSide.BUY, time.time()))
+        matching_engine.insert_limit_order(LimitOrder(5, "S", 10, 10, OrderSide.BUY, time.time()))
+
+        self.assertEqual([order.id for order in matching_engine.ask_book], [2, 3, 1])
+        self.assertEqual([order.id for order in matching_engine.bid_book], [5, 4])
+
+    def test_time_priority_follows_arrival(self):
+        matching_engine = MatchingEngine()
+        matching_engine.handle_limit_order(LimitOrder(1, "S", 5, 10, OrderSide.SELL, 2.0))
+        matching_engine.handle_limit_order(LimitOrder(2, "S", 5, 10, OrderSide.SELL, 1.0))
+        matching_engine.handle_limit_order(LimitOrder(3, "S", 5, 10, OrderSide.SELL, 1.0))
+
+        self.assertEqual([book.id for book in matching_engine.ask_book], [1, 2, 3])
+
     def test_handle_limit_order(self):
         matching_engine = MatchingEngine()
         order = LimitOrder(1, "S", 10, 10, OrderSide.BUY, time.time())
@@ -114,6 +136,100 @@ class TestOrderBook(unittest.TestCase):
         self.assertEqual(filled_orders[2].id, 1)
         self.assertEqual(filled_orders[2].price, 10)
     
+    def test_partial_fill_keeps_resting_order(self):
+        matching_engine = MatchingEngine()
+        order = LimitOrder(1, "S", 10, 10, OrderSide.BUY, time.time())
+        matching_engine.handle_limit_order(order)
+
+        order_sell = LimitOrder(2, "S", 4, 10, OrderSide.SELL, time.time())
+        filled_orders = matching_engine.handle_limit_order(order_sell)
+
+        self.assertIs(matching_engine.bid_book[0], order)
+        self.assertEqual(matching_engine.bid_book[0].quantity, 6)
+        self.assertEqual([(fill.id, fill.quantity) for fill in filled_orders], [(1, 4), (2, 4)])
+
+    def test_fill_report_totals(self):
+        matching_engine = MatchingEngine()
+        matching_engine.handle_limit_order(LimitOrder(1, "S", 4, 10, OrderSide.SELL, time.time()))
+        matching_engine.handle_limit_order(LimitOrder(2, "S", 4, 12, OrderSide.SELL, time.time()))
+
+        filled_orders = matching_engine.handle_limit_order(LimitOrder(3, "S", 10, 12, OrderSide.BUY, time.time()))
+        self.assertEqual(len(filled_orders), 4)
+        self.assertEqual(filled_orders.total_filled, 8)
+        self.assertEqual(filled_orders.vwap, 11)
+        self.assertIsNone(matching_engine.handle_ioc_order(IOCOrder(4, "S", 5, 11, OrderSide.BUY, time.time())).vwap)
+
+    def test_limit_order_crosses_on_ticks(self):
+        matching_engine = MatchingEngine()
+        matching_engine.handle_limit_order(LimitOrder(1, "S", 5, 0.1 + 0.2, OrderSide.SELL, time.time()))
+
+        filled_orders = matching_engine.handle_limit_order(LimitOrder(2, "S", 5, 0.3, OrderSide.BUY, time.time()))
+        self.assertEqual([(fill.id, fill.quantity) for fill in filled_orders], [(1, 5), (2, 5)])
+        self.assertEqual(matching_engine.ask_book, [])
+
+    def test_off_tick_limit_never_trades_beyond_limit(self):
+        matching_engine = MatchingEngine()
+        matching_engine.handle_limit_order(LimitOrder(1, "S", 5, 150.004, OrderSide.SELL, time.time()))
+
+        filled_orders = matching_engine.handle_limit_order(LimitOrder(2, "S", 5, 150.001, OrderSide.BUY, time.time()))
+        self.assertEqual(filled_orders, [])
+        self.assertEqual((matching_engine.bid_book[0].price_ticks, matching_engine.ask_book[0].price_ticks), (15000, 15001))
+
+    def test_price_band_book(self):
+        matching_engine = MatchingEngine(price_bands={"S": (9, 11)})
+        for order in [LimitOrder(1, "S", 5, 10.5, OrderSide.SELL, time.time()),
+                      LimitOrder(2, "S", 5, 12, OrderSide.SELL, time.time()),
+                      LimitOrder(3, "S", 5, 10, OrderSide.SELL, time.time())]:
+            matching_engine.handle_limit_order(order)
+        self.assertEqual([book.id for book in matching_engine.ask_book], [3, 1, 2])
+
+        filled_orders = matching_engine.handle_limit_order(LimitOrder(4, "S", 12, 12, OrderSide.BUY, time.time()))
+        self.assertEqual([fill.id for fill in filled_orders[::2]], [3, 1, 2])
+        self.assertEqual(matching_engine.ask_book[0].quantity, 3)
+
+    def test_flat_price_levels_peekitem(self):
+        levels = FlatPriceLevels(10, 20)
+        self.assertRaises(IndexError, levels.peekitem)
+        levels[12] = "level"
+        self.assertEqual(levels.peekitem(), (12, "level"))
+        self.assertRaises(IndexError, levels.peekitem, -1)
+
+    def test_top_of_book(self):
+        matching_engine = MatchingEngine(price_bands={"S": (9, 11)})
+        for order in [LimitOrder(1, "S", 5, 10, OrderSide.BUY, time.time()),
+                      LimitOrder(2, "S", 5, 8, OrderSide.BUY, time.time()),
+                      LimitOrder(3, "S", 5, 10.5, OrderSide.BUY, time.time())]:
+            matching_engine.handle_limit_order(order)
+        self.assertEqual([book.id for book in matching_engine.top_bids(2)], [3, 1])
+        self.assertEqual([book.id for book in matching_engine.top_bids(5)], [3, 1, 2])
+        self.assertEqual(list(matching_engine.top_asks(5)), [])
+
+    def test_handle_order_returns_fills(self):
+        matching_engine = MatchingEngine()
+        self.assertEqual(matching_engine.handle_order(LimitOrder(1, "S", 5, 10, OrderSide.BUY, time.time())), [])
+
+        filled_orders = matching_engine.handle_order(MarketOrder(2, "S", 3, OrderSide.SELL, time.time()))
+        self.assertEqual([(fill.id, fill.quantity) for fill in filled_orders], [(1, 3), (2, 3)])
+
+    def test_handle_orders(self):
+        matching_engine = MatchingEngine()
+        filled_orders = matching_engine.handle_orders([
+            LimitOrder(1, "S", 5, 10, OrderSide.BUY, time.time()),
+            IOCOrder(2, "S", 2, 10, OrderSide.SELL, time.time()),
+            MarketOrder(3, "S", 2, OrderSide.SELL, time.time()),
+        ])
+        self.assertEqual([(fill.id, fill.quantity) for fill in filled_orders], [(1, 2), (2, 2), (1, 2), (3, 2)])
+        self.assertEqual(matching_engine.bid_book[0].quantity, 1)
+
+    def test_filled_order_pool(self):
+        fill = FilledOrder.acquire(1, "S", 5, 10, OrderSide.BUY, 0, limit=True)
+        FilledOrder.release(fill)
+
+        reused = FilledOrder.acquire(2, "T", 3, 11, OrderSide.SELL, 1)
+        self.assertIs(reused, fill)
+        self.assertEqual((reused.id, reused.symbol, reused.quantity, reused.price, reused.side, reused.limit),
+                         (2, "T", 3, 11, OrderSide.SELL, False))
+
     def test_handle_market_order(self):
         matching_engine = MatchingEngine()
         order_1 = LimitOrder(1, "S", 6, 10, OrderSide.BUY, time.time())
@@ -148,6 +264,17 @@ class TestOrderBook(unittest.TestCase):
         matching_engine.amend_quantity(2, 8)
         self.assertEqual(matching_engine.bid_book[0].quantity, 8)
     
+    def test_amend_quantity_to_zero_cancels(self):
+        matching_engine = MatchingEngine()
+        matching_engine.handle_limit_order(LimitOrder(1, "S", 5, 10, OrderSide.BUY, time.time()))
+        matching_engine.handle_limit_order(LimitOrder(2, "S", 5, 10, OrderSide.BUY, time.time()))
+
+        self.assertTrue(matching_engine.amend_quantity(1, 0))
+        self.assertFalse(matching_engine.amend_quantity(1, 0))
+        self.assertRaises(NonPositiveQuantity, matching_engine.amend_quantity, 2, -1)
+        filled_orders = matching_engine.handle_market_order(MarketOrder(3, "S", 2, OrderSide.SELL, time.time()))
+        self.assertEqual([(fill.id, fill.quantity) for fill in filled_orders], [(2, 2), (3, 2)])
+
     def test_cancel_order(self):
         matching_engine = MatchingEngine()
         order_1 = LimitOrder(1, "S", 5, 10, OrderSide.BUY, time.time())
@@ -158,11 +285,49 @@ class TestOrderBook(unittest.TestCase):
         matching_engine.cancel_order(1)
         self.assertEqual(matching_engine.bid_book[0].id, 2)
 
+    def test_cancel_order_inside_level(self):
+        matching_engine = MatchingEngine()
+        for id in range(1, 4):
+            matching_engine.handle_limit_order(LimitOrder(id, "S", 5, 10, OrderSide.SELL, time.time()))
+
+        self.assertTrue(matching_engine.cancel_order(2))
+        self.assertFalse(matching_engine.cancel_order(2))
+        filled_orders = matching_engine.handle_limit_order(LimitOrder(4, "S", 10, 10, OrderSide.BUY, time.time()))
+        self.assertEqual([fill.id for fill in filled_orders[::2]], [1, 3])
+        self.assertEqual(matching_engine.ask_book, [])
+
 class TestArbitrageOption(unittest.TestCase):
 
     def setUp(self):
         pass
 
+    @unittest.skipIf(_bs_grid is None, "numba is not installed")
+    def test_bs_grid_matches_numpy_pricing(self):
+        S_ask = np.array([70.9, 71.0, 40.0, 120.0])
+        S_bid = np.array([70.7, 70.8, 39.9, 119.8])
+        T = np.array([0.91, 0.5, 0.05, 2.0])
+        K = np.array([60.0, 70.0, 80.0, 60.0, 70.0, 80.0])
+        is_call = np.array([True, True, True, False, False, False])
+        r, sigma = 0.0, 0.2
+        values_short, values_long, deltas_short, deltas_long = _bs_grid(
+            S_ask, S_bid, T, K, is_call, r, sigma)
+
+        S_ask, S_bid, T = S_ask[:, None], S_bid[:, None], T[:, None]
+        K_call, K_put = K[:3], K[3:]
+        np.testing.assert_allclose(values_short[:, :3], call_value(S_ask, K_call, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(values_long[:, :3], call_value(S_bid, K_call, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(deltas_short[:, :3], -call_delta(S_ask, K_call, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(deltas_long[:, :3], call_delta(S_bid, K_call, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(values_long[:, 3:], put_value(S_ask, K_put, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(values_short[:, 3:], put_value(S_bid, K_put, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(deltas_long[:, 3:], put_delta(S_ask, K_put, T, r, sigma), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(deltas_short[:, 3:], -put_delta(S_bid, K_put, T, r, sigma), rtol=1e-9, atol=1e-12)
+
+    def test_read_market_csv_falls_back_for_text_columns(self):
+        data = read_market_csv(io.StringIO("Time,BidPrice-Stock,Venue\n2018-01-01 00:05:00,70.7,X\n"))
+        self.assertEqual(list(data.dtypes), [np.float64, object])
+        self.assertEqual(data.index[0], "2018-01-01 00:05:00")
+
     def test_read_data(self):
         filename = io.StringIO(data_string)
         time_to_expiry, market_data = read_data(filename)
@@ -192,9 +357,11 @@ class TestArbitrageOption(unittest.TestCase):
                                                     option_names)
         # Show DataFrames
         print('Option Values')
-        print(option_values.head().to_string())
+        print(option_values.head().round(2).to_string())
         print('Option Deltas')
         print(option_deltas.head().to_string())
+        self.assertTrue(option_values.columns.is_monotonic_increasing)
+        self.assertTrue(option_deltas.columns.is_monotonic_increasing)
 
     def test_add_blacksholes_data_to_market_data(self):
         filename = io.StringIO(data_string)
@@ -209,6 +376,7 @@ class TestArbitrageOption(unittest.TestCase):
                                                  option_values,\
                                                  option_deltas)
         print(df.head(10).to_string())
+        self.assertTrue(df.columns.is_monotonic_increasing)
 
 
     def test_option_opportunity(self):
@@ -268,6 +436,205 @@ class TestArbitrageOption(unittest.TestCase):
         print(final_position)
 
 
+class TestBrokerAdapters(unittest.TestCase):
+
+    def setUp(self):
+        self.broker = broker_adapters.SimulatedBrokerAdapter()
+        self.broker.connect()
+
+    def limit_order(self, id, quantity, price, side):
+        om = broker_adapters.om
+        return om.LimitOrder(id, "S", quantity, price, side, float(id))
+
+    def test_modify_order_to_zero_cancels(self):
+        om = broker_adapters.om
+        order_id = self.broker.submit_order(self.limit_order(1, 10, 10, om.OrderSide.BUY))
+        self.assertTrue(self.broker.modify_order(order_id, 0))
+
+        self.assertEqual(self.broker.get_order_status(order_id)['status'], 'cancelled')
+        self.assertEqual(self.broker.get_open_orders(), [])
+        self.assertEqual(list(self.broker.iter_open_orders()), [])
+        self.assertFalse(self.broker.modify_order(order_id, 0))
+
+    def test_batching_keeps_submission_order(self):
+        om = broker_adapters.om
+        baskets = []
+        batch_submit_orders = self.broker.batch_submit_orders
+
+        def record(orders):
+            baskets.append([order.id for order in orders])
+            return batch_submit_orders(orders)
+
+        self.broker.batch_submit_orders = record
+        batching = broker_adapters.BatchingBrokerAdapter(self.broker, interval_ms=10000, max_batch=3)
+
+        async def submit():
+            limit = asyncio.ensure_future(
+                batching.submit_order_async(self.limit_order(1, 10, 10, om.OrderSide.SELL)))
+            cancelled = asyncio.ensure_future(
+                batching.submit_order_async(self.limit_order(2, 10, 11, om.OrderSide.SELL)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            markets = await asyncio.gather(
+                *(batching.submit_order_async(om.MarketOrder(id, "S", 3, om.OrderSide.BUY, float(id)))
+                  for id in (3, 4, 5)))
+            return [await limit] + markets
+
+        order_ids = asyncio.run(submit())
+
+        # The market basket takes the earlier limit order along and drops the cancelled one
+        self.assertEqual(baskets, [[1, 3, 4, 5]])
+        self.assertEqual(order_ids, ["SIM000001", "SIM000002", "SIM000003", "SIM000004"])
+        self.assertEqual([order["order_id"] for order in batching.get_open_orders()], ["SIM000001"])
+
+        self.assertTrue(batching.disconnect())
+        self.assertFalse(self.broker.connected)
+        self.assertRaises(RuntimeError, batching.get_positions)
+
+    def test_ttl_cache_expires(self):
+        class Probe:
+            calls = 0
+
+            @broker_adapters.ttl_cache(1.0)
+            def query(self):
+                self.calls += 1
+                return self.calls
+
+        probe = Probe()
+        with unittest.mock.patch.object(broker_adapters.time, "monotonic", return_value=100.0):
+            self.assertEqual(probe.query(), 1)
+            self.assertEqual(probe.query(), 1)
+        with unittest.mock.patch.object(broker_adapters.time, "monotonic", return_value=100.5):
+            self.assertEqual(probe.query(), 1)
+        with unittest.mock.patch.object(broker_adapters.time, "monotonic", return_value=101.0):
+            self.assertEqual(probe.query(), 2)
+
+    def test_order_events_invalidate_cache(self):
+        om = broker_adapters.om
+        positions = self.broker.get_positions()
+        self.assertEqual(positions, {})
+        self.assertIs(self.broker.get_positions(), positions)
+
+        sell_id = self.broker.submit_order(self.limit_order(1, 10, 10, om.OrderSide.SELL))
+        self.assertEqual(self.broker.get_account_info()['orders_submitted'], 1)
+        self.broker.submit_order(om.MarketOrder(2, "S", 4, om.OrderSide.BUY, 2.0))
+        self.assertEqual(self.broker.get_positions(), {"S": 0})
+        self.assertEqual(self.broker.get_account_info()['fills_count'], 2)
+
+        positions = self.broker.get_positions()
+        self.assertTrue(self.broker.cancel_order(sell_id))
+        self.assertIsNot(self.broker.get_positions(), positions)
+
+    def test_invalidate_cache(self):
+        self.assertEqual(self.broker.get_account_info()['cash'], 100000.0)
+        self.broker.cash = 50000.0
+        self.assertEqual(self.broker.get_account_info()['cash'], 100000.0)
+        self.broker.invalidate_cache()
+        self.assertEqual(self.broker.get_account_info()['cash'], 50000.0)
+
+    def test_engine_created_on_first_order(self):
+        self.assertNotIn("engine", vars(self.broker))
+        self.broker.get_open_orders()
+        self.assertNotIn("engine", vars(self.broker))
+        self.broker.submit_order(self.limit_order(1, 10, 10, broker_adapters.om.OrderSide.BUY))
+        self.assertIsInstance(self.broker.engine, broker_adapters.om.MatchingEngine)
+
+    def test_open_records_track_open_orders(self):
+        om = broker_adapters.om
+        resting_id = self.broker.submit_order(self.limit_order(1, 10, 10, om.OrderSide.SELL))
+        ioc_id = self.broker.submit_order(om.IOCOrder(2, "S", 5, 9, om.OrderSide.BUY, 2.0))
+        filled_id = self.broker.submit_order(om.MarketOrder(3, "S", 4, om.OrderSide.BUY, 3.0))
+
+        self.assertEqual(self.broker.records[ioc_id].status, broker_adapters.OrderStatus.CANCELLED)
+        self.assertEqual(self.broker.records[filled_id].status, broker_adapters.OrderStatus.FILLED)
+        self.assertEqual(list(self.broker.open_records), [resting_id])
+
+        view = next(self.broker.iter_open_orders())
+        self.assertEqual(view, broker_adapters.OpenOrderView(resting_id, "S", 6, "SELL", "LIMIT", 10))
+        self.assertEqual(view._asdict(), self.broker.get_open_orders()[0])
+
+        self.assertTrue(self.broker.cancel_order(resting_id))
+        self.assertEqual(self.broker.open_records, {})
+        self.assertFalse(self.broker.cancel_order(resting_id))
+
+    def test_fills_are_netted_per_symbol(self):
+        om = broker_adapters.om
+        self.broker.submit_order(self.limit_order(1, 5, 10, om.OrderSide.SELL))
+        self.broker.submit_order(self.limit_order(2, 5, 11, om.OrderSide.SELL))
+        self.broker.submit_order(om.MarketOrder(3, "S", 8, om.OrderSide.BUY, 3.0))
+
+        self.assertEqual(self.broker.positions, {"S": 0})
+        self.assertEqual(self.broker.cash, 100000.0)
+        self.broker._apply_fills([om.FilledOrder(4, "S", 3, 10.1, om.OrderSide.BUY, 4.0),
+                                  om.FilledOrder(5, "S", 1, 10.3, om.OrderSide.SELL, 5.0),
+                                  om.FilledOrder(6, "T", 2, 1.0, om.OrderSide.SELL, 6.0)])
+        self.assertEqual(self.broker.positions, {"S": 2, "T": -2})
+        self.assertAlmostEqual(self.broker.cash, 100000.0 - 30.3 + 10.3 + 2.0)
+
+    def test_batch_submit_and_cancel(self):
+        om = broker_adapters.om
+        order_ids = self.broker.batch_submit_orders(
+            [self.limit_order(1, 10, 10, om.OrderSide.SELL),
+             self.limit_order(2, 10, 9, om.OrderSide.BUY),
+             om.MarketOrder(3, "S", 4, om.OrderSide.BUY, 3.0)])
+
+        self.assertEqual(order_ids, ["SIM000001", "SIM000002", "SIM000003"])
+        self.assertEqual(self.broker.get_positions(), {"S": 0})
+        self.assertEqual(self.broker.batch_cancel_orders(order_ids), [True, True, False])
+        self.assertEqual(self.broker.get_open_orders(), [])
+
+        self.broker.disconnect()
+        self.assertRaises(ConnectionError, self.broker.batch_submit_orders, [])
+
+    def test_submit_orders_async_keeps_order(self):
+        om = broker_adapters.om
+        orders = [self.limit_order(id, 10, 10, om.OrderSide.SELL) for id in (1, 2, 3)]
+        order_ids = asyncio.run(self.broker.submit_orders_async(orders))
+
+        self.assertEqual(order_ids, ["SIM000001", "SIM000002", "SIM000003"])
+        self.assertEqual([view.order_id for view in self.broker.iter_open_orders()], order_ids)
+
+    def test_batching_flushes_on_interval_and_max_batch(self):
+        om = broker_adapters.om
+        baskets = []
+        batch_submit_orders = self.broker.batch_submit_orders
+
+        def record(orders):
+            baskets.append([order.id for order in orders])
+            return batch_submit_orders(orders)
+
+        self.broker.batch_submit_orders = record
+        batching = broker_adapters.BatchingBrokerAdapter(self.broker, interval_ms=1, max_batch=2)
+        orders = [self.limit_order(id, 10, 10, om.OrderSide.SELL) for id in (1, 2, 3)]
+        order_ids = asyncio.run(batching.submit_orders_async(orders))
+
+        # The first two fill a basket; the third goes when the interval runs out
+        self.assertEqual(baskets, [[1, 2], [3]])
+        self.assertEqual(order_ids, ["SIM000001", "SIM000002", "SIM000003"])
+        batching.disconnect()
+
+    def test_batching_rejects_short_basket(self):
+        om = broker_adapters.om
+        self.broker.batch_submit_orders = lambda orders: ["SIM000001"]
+        batching = broker_adapters.BatchingBrokerAdapter(self.broker, max_batch=2)
+        orders = [self.limit_order(id, 10, 10, om.OrderSide.SELL) for id in (1, 2)]
+
+        self.assertRaises(RuntimeError, asyncio.run, batching.submit_orders_async(orders))
+        batching.disconnect()
+
+    def test_single_thread_close(self):
+        om = broker_adapters.om
+        single = broker_adapters.SingleThreadBrokerAdapter(self.broker)
+        order_id = asyncio.run(single.submit_order_async(self.limit_order(1, 10, 10, om.OrderSide.SELL)))
+        self.assertEqual(single.get_order_status(order_id)['status'], 'pending')
+
+        self.assertTrue(single.disconnect())
+        self.assertFalse(single._worker.is_alive())
+        self.assertFalse(self.broker.connected)
+        self.assertRaises(RuntimeError, single.get_open_orders)
+        single.close()
+
+
 suite = unittest.TestLoader().loadTestsFromModule(__main__)
 buf = io.StringIO()
 unittest.TextTestRunner(stream=buf, verbosity=2).run(suite)